@@ -9,82 +9,174 @@ How to use:
 Outputs appear in ./meta_output next to this file.
 """
 
-import os, json, glob
+import os, json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+
+from screening.src.cpus import available_cpus
+
+# orjson is optional: a C parser, noticeably faster than stdlib json on big folders
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyarrow is optional: its C CSV writer is several times faster than DataFrame.to_csv.
+# Its output is equivalent, not byte-identical (see _write_csv); VV_PANDAS_CSV=1 keeps to_csv.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+USE_PYARROW_CSV = HAS_PYARROW and os.getenv("VV_PANDAS_CSV", "0").lower() not in {"1","true","yes"}
 
 Z = 1.96
+# one effects row; text fields are objects so long ids are never truncated and None survives
+_ROW_DTYPE = np.dtype([
+    ("file", object), ("study_id", object), ("design", object), ("species", object),
+    ("outcome", object), ("type", object), ("timepoint_weeks", "f8"),
+    ("estimate", "f8"), ("ci_low", "f8"), ("ci_high", "f8"), ("p_value", "f8"),
+    ("adjusted", object), ("unit", object), ("model_notes", object),
+])
+# below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 64
+
+@lru_cache(maxsize=4096)
+def _coerce_str(x: str) -> float:
+    # JSON cells repeat the same few strings ("", "NaN", "n/a", "12") a lot
+    if x.strip() == "":
+        return np.nan
+    try:
+        return float(x)
+    except ValueError:
+        return np.nan
 
 def coerce_float(x):
-    if x is None or (isinstance(x, str) and str(x).strip() == ""):
+    # fast path: values from JSON/NumPy are usually numbers already
+    if isinstance(x, (float, int, np.floating, np.integer)):
+        return float(x)
+    if x is None:
         return np.nan
+    if isinstance(x, str):
+        return _coerce_str(x)
     try:
-        return float(x)
+        return float(str(x))  # Decimal and other number-like objects
     except Exception:
-        try:
-            if str(x).lower() in {"nan", "none"}:
-                return np.nan
-        except Exception:
-            pass
         return np.nan
 
 def se_from_ci(ci_low, ci_high):
-    lo, hi = coerce_float(ci_low), coerce_float(ci_high)
-    if np.isnan(lo) or np.isnan(hi):
-        return np.nan
-    return (hi - lo) / (2 * Z)
+    """SE from one pair of 95% CI bounds; scalar form of _se_vec."""
+    return (coerce_float(ci_high) - coerce_float(ci_low)) / (2 * Z)
 
-def _classify_arm(arm_name: Optional[str]) -> Optional[str]:
-    s = str(arm_name or "").strip().lower()
-    if s in {"intervention", "treated", "exposed"}:
-        return "intervention"
-    if s in {"control", "placebo", "unexposed"}:
-        return "control"
-    return None
+# arm label -> role; one dict lookup per arm instead of rebuilding sets per call
+_ARM_TAGS = {
+    "intervention": "intervention", "treated": "intervention", "exposed": "intervention",
+    "control": "control", "placebo": "control", "unexposed": "control",
+}
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """
+    Write df without its index, via pyarrow when available, else pandas.
+    pyarrow quotes the header and every string field, and writes floats in
+    shortest round-trip form (26 rather than 26.0, 1e+16, 0.00001); the
+    values read back identically, only the bytes differ.
+    """
+    if USE_PYARROW_CSV:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, path, pacsv.WriteOptions(quoting_style="needed"))
+            return
+        except (pa.ArrowException, TypeError):
+            pass  # unsupported column type or old pyarrow; pandas handles everything
+    df.to_csv(path, index=False)
+
+def _float_col(col) -> np.ndarray:
+    """Column as a float array; only non-numeric columns go through string coercion."""
+    if pd.api.types.is_float_dtype(col):
+        return np.asarray(col, dtype=float)
+    return pd.to_numeric(col, errors="coerce").to_numpy(dtype=float)
+
+def _se_vec(ci_low, ci_high) -> np.ndarray:
+    """SE from 95% CI bounds, column-wise: (hi - lo) / (2 * Z); unparsable bounds become NaN."""
+    return (_float_col(ci_high) - _float_col(ci_low)) / (2 * Z)
 
 def _compute_smd_ci(a: Dict[str, Any], b: Dict[str, Any]) -> Tuple[float, float, float]:
     """
-    Hedges' g and 95% CI from two arms at follow-up.
-    g = J * d, d = (m1 - m0) / s_pooled
-    s_pooled = sqrt( ((n1-1)s1^2 + (n0-1)s0^2) / (n1 + n0 - 2) )
-    Var(g) ≈ J^2 * ( (n1 + n0)/(n1*n0) + d^2 / (2*(n1 + n0 - 2)) )
+    Hedges' g and 95% CI for one intervention/control arm pair; scalar form
+    of _compute_smd_ci_vec. Raises ValueError where that marks a row invalid.
     """
-    m1 = coerce_float(a.get("followup_mean"))
-    s1 = coerce_float(a.get("followup_sd"))
-    n1 = coerce_float(a.get("n"))
-    m0 = coerce_float(b.get("followup_mean"))
-    s0 = coerce_float(b.get("followup_sd"))
-    n0 = coerce_float(b.get("n"))
-
-    if any(np.isnan(v) for v in (m1, s1, n1, m0, s0, n0)) or n1 <= 1 or n0 <= 1:
-        raise ValueError("Missing or invalid follow-up stats for SMD computation")
+    def arms(key: str) -> Tuple[np.ndarray, np.ndarray]:
+        return np.array([coerce_float(a.get(key))]), np.array([coerce_float(b.get(key))])
 
-    df = (n1 + n0 - 2)
-    if df <= 0:
-        raise ValueError("Non-positive degrees of freedom for SMD")
+    (m1, m0), (s1, s0), (n1, n0) = arms("followup_mean"), arms("followup_sd"), arms("n")
+    g, lo, hi, valid = _compute_smd_ci_vec(m1, s1, n1, m0, s0, n0)
+    if not valid[0]:
+        raise ValueError("Missing or invalid follow-up stats for SMD computation")
+    return float(g[0]), float(lo[0]), float(hi[0])
 
-    sp2 = (((n1 - 1) * (s1 ** 2)) + ((n0 - 1) * (s0 ** 2))) / df
-    if sp2 <= 0:
-        raise ValueError("Non-positive pooled variance for SMD")
+def _dl_pool(gid: np.ndarray, y: np.ndarray, se2: np.ndarray, n: int):
+    """
+    DerSimonian-Laird random-effects pooling for n groups at once: per-row
+    terms summed per group id (0..n-1) with bincount.
+    Returns (pooled, se_pooled, tau2, I2) arrays of length n.
+    """
+    k = np.bincount(gid, minlength=n)
+    w = 1.0 / se2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        S_w = np.bincount(gid, w, n)
+        fixed = np.bincount(gid, w * y, n) / S_w
+        q = np.bincount(gid, w * (y - fixed[gid]) ** 2, n)
+        c = S_w - np.bincount(gid, w * w, n) / S_w
+        tau2 = np.where(k > 1, np.maximum(0.0, (q - (k - 1)) / c), 0.0)
+        w_star = 1.0 / (se2 + tau2[gid])
+        S_ws = np.bincount(gid, w_star, n)
+        pooled = np.bincount(gid, w_star * y, n) / S_ws
+        se_pooled = np.sqrt(1.0 / S_ws)
+        I2 = np.where((k > 1) & (q > 0), np.maximum(0.0, (q - (k - 1)) / q) * 100.0, 0.0)
+    return pooled, se_pooled, tau2, I2
 
-    sp = np.sqrt(sp2)
-    d = (m1 - m0) / sp
-    J = 1.0 - 3.0 / (4.0 * df - 1.0)  # Hedges' small-sample correction
-    g = J * d
+def _classify_arm(arm_name: Optional[str]) -> Optional[str]:
+    if not arm_name:
+        return None
+    return _ARM_TAGS.get(str(arm_name).strip().lower())
 
-    var_g = (J ** 2) * ((n1 + n0) / (n1 * n0) + (d ** 2) / (2.0 * df))
-    se_g = np.sqrt(var_g)
-    lo, hi = g - Z * se_g, g + Z * se_g
-    return float(g), float(lo), float(hi)
+def _compute_smd_ci_vec(m1: np.ndarray, s1: np.ndarray, n1: np.ndarray,
+                        m0: np.ndarray, s0: np.ndarray, n0: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Hedges' g and 95% CI from two arms at follow-up, for many arm pairs at once.
+    g = J * d, d = (m1 - m0) / s_pooled
+    s_pooled = sqrt( ((n1-1)s1^2 + (n0-1)s0^2) / (n1 + n0 - 2) )
+    Var(g) ≈ J^2 * ( (n1 + n0)/(n1*n0) + d^2 / (2*(n1 + n0 - 2)) )
+    Returns (g, lo, hi, valid); rows where `valid` is False (missing stats,
+    n <= 1, non-positive df or pooled variance) hold meaningless values.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df = n1 + n0 - 2
+        sp2 = ((n1 - 1) * (s1 ** 2) + (n0 - 1) * (s0 ** 2)) / df
+        valid = (
+            ~(np.isnan(m1) | np.isnan(s1) | np.isnan(n1) | np.isnan(m0) | np.isnan(s0) | np.isnan(n0))
+            & (n1 > 1) & (n0 > 1) & (df > 0) & (sp2 > 0)
+        )
+        d = (m1 - m0) / np.sqrt(sp2)
+        J = 1.0 - 3.0 / (4.0 * df - 1.0)  # Hedges' small-sample correction
+        g = J * d
+        se_g = J * np.sqrt((n1 + n0) / (n1 * n0) + (d * d) / (2.0 * df))
+        lo, hi = g - Z * se_g, g + Z * se_g
+    return g, lo, hi, valid
 
 class MetaAnalyzer:
-    def __init__(self, json_paths: List[str], outdir: str, min_k: int = 2):
+    def __init__(self, json_paths: List[str], outdir: str, min_k: int = 2, plot_dpi: int = 150):
         self.json_paths = sorted(json_paths)
         self.outdir = outdir
         self.min_k = int(min_k)
+        self.plot_dpi = int(plot_dpi)  # raise (e.g. 300) for publication-quality forest plots
         os.makedirs(self.outdir, exist_ok=True)
         self.forest_dir = os.path.join(self.outdir, "forest_plots")
         os.makedirs(self.forest_dir, exist_ok=True)
@@ -94,22 +186,43 @@ class MetaAnalyzer:
 
     @staticmethod
     def resolve_json_paths(folder: str) -> List[str]:
-        pattern = os.path.join(folder, "*.json")
-        return sorted(glob.glob(pattern))
+        # single directory read; DirEntry carries the file type, no per-name fnmatch.
+        # like the old glob: missing folder -> [], dot-files are skipped
+        if not os.path.isdir(folder):
+            return []
+        with os.scandir(folder) as it:
+            paths = [e.path for e in it
+                     if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()]
+        paths.sort()
+        return paths
 
     @staticmethod
-    def load_effect_rows(path: str) -> List[Dict[str, Any]]:
+    def load_effect_rows(path: str) -> np.ndarray:
         """
         NEW SCHEMA READER (SMD-only):
         - consumes arm-level `outcomes` list
         - pairs intervention vs control per (name, timepoint_weeks)
         - computes Hedges' g + CI on follow-up values
+        - returns one `_ROW_DTYPE` record per effect
         """
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = None
+        if HAS_ORJSON:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN literals, which only the stdlib parser accepts
+        if data is None:
+            data = json.loads(raw.decode("utf-8"))
 
         study = data.get("study_metadata", {}) or {}
         outcomes = data.get("outcomes", []) or []
+        # study-level fields are the same for every effect of the file
+        fname = os.path.basename(path)
+        sid = study.get("study_id") or fname
+        design = study.get("design")
+        species = study.get("species")
 
         # group rows by (name, timepoint_weeks)
         groups: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
@@ -119,9 +232,9 @@ class MetaAnalyzer:
             key = (r.get("name"), r.get("timepoint_weeks"))
             groups.setdefault(key, []).append(r)
 
-        rows = []
+        # pick one intervention and one control per (name, timepoint)
+        pairs: List[Tuple[Any, Any, Dict[str, Any], Dict[str, Any]]] = []
         for (name, tp), arm_rows in groups.items():
-            # pick one intervention and one control
             a_row = None
             b_row = None
             for r in arm_rows:
@@ -130,32 +243,37 @@ class MetaAnalyzer:
                     a_row = r
                 elif tag == "control" and b_row is None:
                     b_row = r
-            if not a_row or not b_row:
-                continue
-
-            try:
-                g, glo, ghi = _compute_smd_ci(a_row, b_row)
-            except Exception:
-                continue
+            if a_row and b_row:
+                pairs.append((name, coerce_float(tp), a_row, b_row))
+        if not pairs:
+            return np.empty(0, dtype=_ROW_DTYPE)
+
+        # Hedges' g for every pair of the file in one array pass
+        def col(idx: int, key: str) -> np.ndarray:
+            return np.fromiter((coerce_float(p[idx].get(key)) for p in pairs), dtype=float, count=len(pairs))
+
+        g, glo, ghi, valid = _compute_smd_ci_vec(
+            col(2, "followup_mean"), col(2, "followup_sd"), col(2, "n"),
+            col(3, "followup_mean"), col(3, "followup_sd"), col(3, "n"),
+        )
 
-            rows.append({
-                "file": os.path.basename(path),
-                "study_id": study.get("study_id") or os.path.basename(path),
-                "design": study.get("design"),
-                "species": study.get("species"),
-                "outcome": name,
-                "type": "SMD",
-                "timepoint_weeks": coerce_float(tp),
-                "estimate": g,
-                "ci_low": glo,
-                "ci_high": ghi,
-                "p_value": np.nan,
-                "adjusted": None,
-                "unit": "SD units",
-                "model_notes": "Computed from follow-up means & SDs (Hedges' g)",
-            })
-
-        return rows
+        idx = np.flatnonzero(valid)
+        recs = np.empty(len(idx), dtype=_ROW_DTYPE)
+        recs["file"] = fname
+        recs["study_id"] = sid
+        recs["design"] = design
+        recs["species"] = species
+        recs["outcome"] = [pairs[i][0] for i in idx]
+        recs["type"] = "SMD"
+        recs["timepoint_weeks"] = [pairs[i][1] for i in idx]
+        recs["estimate"] = g[idx]
+        recs["ci_low"] = glo[idx]
+        recs["ci_high"] = ghi[idx]
+        recs["p_value"] = np.nan
+        recs["adjusted"] = None
+        recs["unit"] = "SD units"
+        recs["model_notes"] = "Computed from follow-up means & SDs (Hedges' g)"
+        return recs
 
     @staticmethod
     def unit_consistent(group: pd.DataFrame) -> Tuple[bool, Optional[str]]:
@@ -164,55 +282,61 @@ class MetaAnalyzer:
 
     @staticmethod
     def dersimonian_laird(ests: np.ndarray, ses: np.ndarray) -> Tuple[float, Tuple[float, float], float, float]:
-        w = 1.0 / (ses ** 2)
-        fixed = np.sum(w * ests) / np.sum(w)
-        q = np.sum(w * (ests - fixed) ** 2)
-        k = len(ests)
-        if k <= 1:
-            tau2 = 0.0
-            w_star = w
-        else:
-            c = np.sum(w) - (np.sum(w ** 2) / np.sum(w))
-            tau2 = max(0.0, (q - (k - 1)) / c)
-            w_star = 1.0 / (ses ** 2 + tau2)
-
-        pooled = np.sum(w_star * ests) / np.sum(w_star)
-        se_pooled = (1.0 / np.sum(w_star)) ** 0.5
-        ci = (pooled - Z * se_pooled, pooled + Z * se_pooled)
-
-        I2 = 0.0
-        if k > 1 and q > 0:
-            I2 = max(0.0, (q - (k - 1)) / q) * 100.0
-
-        return pooled, ci, tau2, I2
+        """(pooled, (ci_low, ci_high), tau2, I2) for one group; pool_groups pools all groups at once."""
+        ests = np.asarray(ests, dtype=float)
+        ses = np.asarray(ses, dtype=float)
+        pooled, se_pooled, tau2, I2 = _dl_pool(np.zeros(len(ests), dtype=np.intp), ests, ses ** 2, 1)
+        p, se = float(pooled[0]), float(se_pooled[0])
+        return p, (p - Z * se, p + Z * se), float(tau2[0]), float(I2[0])
 
     @staticmethod
-    def readiness_reason(estimate, ci_low, ci_high):
-        est = coerce_float(estimate)
-        if np.isnan(est):
+    def readiness_reason(estimate, ci_low, ci_high, se=None):
+        # per-row form of the readiness rule; build_effects applies it column-wise.
+        # pass an already computed `se` to skip re-deriving it from the CI bounds.
+        if np.isnan(coerce_float(estimate)):
             return "No effect estimate"
-        if np.isnan(se_from_ci(ci_low, ci_high)):
+        if se is None:
+            se = se_from_ci(ci_low, ci_high)
+        if np.isnan(coerce_float(se)):
             return "Missing CI (or unparsable)"
         return "Ready"
 
     def build_effects(self) -> pd.DataFrame:
-        all_rows = []
-        for p in self.json_paths:
-            try:
-                rows = self.load_effect_rows(p)
-                all_rows.extend(rows)
-            except Exception as e:
-                print(f"ERROR reading {p}: {e}")
-        effects = pd.DataFrame(all_rows)
+        all_recs = []
+        if len(self.json_paths) >= PARALLEL_MIN_FILES:
+            # files are independent: parse them across cores, results come back in path order
+            with ProcessPoolExecutor(max_workers=available_cpus()) as ex:
+                results = list(ex.map(_load_rows_or_error, self.json_paths, chunksize=8))
+        else:
+            results = [_load_rows_or_error(p) for p in self.json_paths]
+        for p, (recs, err) in zip(self.json_paths, results):
+            if err is not None:
+                print(f"ERROR reading {p}: {err}")
+                continue
+            all_recs.append(recs)
+        recs = np.concatenate(all_recs) if all_recs else np.empty(0, dtype=_ROW_DTYPE)
+        effects = pd.DataFrame(recs) if len(recs) else pd.DataFrame()
         if effects.empty:
             print("No effects found in JSONs.")
             self.effects_df = effects
             return effects
 
-        effects["readiness"] = effects.apply(
-            lambda r: self.readiness_reason(r["estimate"], r["ci_low"], r["ci_high"]), axis=1
+        # readiness rules on whole columns: no estimate, then no usable CI;
+        # SE is derived once here and readiness, pooling and plots all reuse it
+        est = _float_col(effects["estimate"])
+        se = _se_vec(effects["ci_low"], effects["ci_high"])
+        effects["readiness"] = np.select(
+            [np.isnan(est), np.isnan(se)],
+            ["No effect estimate", "Missing CI (or unparsable)"],
+            default="Ready",
         )
-        effects["SE"] = effects.apply(lambda r: se_from_ci(r["ci_low"], r["ci_high"]), axis=1)
+        effects["SE"] = se
+
+        # compact layout: low-cardinality labels as categoricals (groupby on int codes);
+        # estimate/CI/SE feed pooling and stay float64, display-only timepoints go float32
+        for c in ("file", "study_id", "design", "species", "outcome", "type", "unit", "adjusted", "model_notes"):
+            effects[c] = effects[c].astype("category")
+        effects["timepoint_weeks"] = effects["timepoint_weeks"].astype("float32")
         self.effects_df = effects
         return effects
 
@@ -221,9 +345,10 @@ class MetaAnalyzer:
             return
         effects_csv = os.path.join(self.outdir, "effects.csv")
         readiness_csv = os.path.join(self.outdir, "readiness.csv")
-        self.effects_df.to_csv(effects_csv, index=False)
-        self.effects_df[["file", "study_id", "outcome", "type", "timepoint_weeks", "readiness"]].to_csv(
-            readiness_csv, index=False
+        _write_csv(self.effects_df, effects_csv)
+        _write_csv(
+            self.effects_df[["file", "study_id", "outcome", "type", "timepoint_weeks", "readiness"]],
+            readiness_csv,
         )
         print(f"Saved: {effects_csv}")
         print(f"Saved: {readiness_csv}")
@@ -233,99 +358,155 @@ class MetaAnalyzer:
             self.pooled_df = pd.DataFrame()
             return self.pooled_df
 
+        min_k = self.min_k
+        keys = ["outcome", "type"]
+        effects = self.effects_df
+        # one combined mask, one slice: Ready rows with a usable estimate and SE
+        ready_mask = (
+            (effects["readiness"].to_numpy() == "Ready")
+            & effects["estimate"].notna().to_numpy()
+            & effects["SE"].notna().to_numpy()
+        )
+        ready = effects[ready_mask]
+
+        # DerSimonian-Laird for every group at once: per-row terms, summed per group id
+        gb = ready.groupby(keys, sort=True, dropna=False, observed=True)
+        gid = gb.ngroup().to_numpy()
+        k_ready = gb.size()
+        n = len(k_ready)
+        k = k_ready.to_numpy()
+        pooled, se_pooled, tau2, I2 = _dl_pool(
+            gid, ready["estimate"].to_numpy(dtype=float), ready["SE"].to_numpy(dtype=float) ** 2, n)
+
+        # per-group frames are only needed for the unit check and the forest plots
+        frames = [g for _, g in gb]
+        stats = pd.DataFrame({
+            "k": k, "pooled": pooled, "ci_low": pooled - Z * se_pooled, "ci_high": pooled + Z * se_pooled,
+            "tau2": tau2, "I2": I2, "pos": np.arange(n),
+        }, index=k_ready.index)
+        # groups with no ready rows still get a summary line, as before
+        all_groups = effects.groupby(keys, sort=True, dropna=False, observed=True).size().index
+        stats = stats.reindex(all_groups)
+
         pooled_rows = []
-        grouped = self.effects_df.groupby(["outcome", "type"], dropna=False)
-        for (outcome, etype), g in grouped:
-            g_ready = g[(g["readiness"] == "Ready")].copy()
-            g_ready = g_ready.dropna(subset=["estimate", "SE"])
+        plot_tasks = []
+        empty = ready.iloc[:0]
+        for (outcome, etype), st in zip(all_groups, stats.itertuples(index=False)):
+            g_ready = empty if np.isnan(st.pos) else frames[int(st.pos)]
+            k_g = int(len(g_ready))
 
             ok_units, unit = self.unit_consistent(g_ready)
             if not ok_units:
                 pooled_rows.append({
-                    "outcome": outcome, "type": etype, "k": int(len(g_ready)),
+                    "outcome": outcome, "type": etype, "k": k_g,
                     "pooled": np.nan, "ci_low": np.nan, "ci_high": np.nan,
                     "tau2": np.nan, "I2": np.nan, "unit": None,
                     "note": "Unit mismatch within group; skipping pooling",
                 })
                 continue
 
-            if len(g_ready) < MIN_K:
+            if k_g < min_k:
                 pooled_rows.append({
-                    "outcome": outcome, "type": etype, "k": int(len(g_ready)),
+                    "outcome": outcome, "type": etype, "k": k_g,
                     "pooled": np.nan, "ci_low": np.nan, "ci_high": np.nan,
                     "tau2": np.nan, "I2": np.nan, "unit": unit,
-                    "note": f"Less than min-k ({MIN_K}); skipping pooling",
+                    "note": f"Less than min-k ({min_k}); skipping pooling",
                 })
                 continue
 
-            ests = g_ready["estimate"].values.astype(float)
-            ses = g_ready["SE"].values.astype(float)
-
-            pooled, (lo, hi), tau2, I2 = self.dersimonian_laird(ests, ses)
             pooled_row = {
-                "outcome": outcome, "type": etype, "k": int(len(g_ready)),
-                "pooled": pooled, "ci_low": lo, "ci_high": hi, "tau2": tau2, "I2": I2,
+                "outcome": outcome, "type": etype, "k": k_g,
+                "pooled": st.pooled, "ci_low": st.ci_low, "ci_high": st.ci_high,
+                "tau2": st.tau2, "I2": st.I2,
                 "unit": unit, "note": "OK",
             }
             pooled_rows.append(pooled_row)
 
             if make_plots:
                 outpng = os.path.join(self.forest_dir, f"{str(outcome).replace(' ','_')}__{etype or 'NA'}.png")
+                plot_tasks.append((g_ready, pooled_row, outpng))
+
+        if plot_tasks:
+            def _plot(task):
+                g_ready, pooled_row, outpng = task
                 try:
-                    self.make_forest_plot(g_ready, pooled_row, outpng)
+                    self.make_forest_plot(g_ready, pooled_row, outpng, dpi=self.plot_dpi)
                 except Exception as e:
-                    print(f"Forest plot failed for {outcome}/{etype}: {e}")
+                    print(f"Forest plot failed for {pooled_row['outcome']}/{pooled_row['type']}: {e}")
+
+            if len(plot_tasks) == 1:
+                _plot(plot_tasks[0])
+            else:
+                # each plot owns its Figure; Agg rendering and PNG encoding release the GIL
+                with ThreadPoolExecutor(max_workers=available_cpus()) as ex:
+                    list(ex.map(_plot, plot_tasks))
 
         pooled_df = pd.DataFrame(pooled_rows)
         self.pooled_df = pooled_df
 
         pooled_csv = os.path.join(self.outdir, "pooled_summary.csv")
-        pooled_df.to_csv(pooled_csv, index=False)
+        _write_csv(pooled_df, pooled_csv)
         print(f"Saved: {pooled_csv}")
         print(f"Forest plots: {self.forest_dir}")
         return pooled_df
 
-    @staticmethod
-    def make_forest_plot(group: pd.DataFrame, pooled_row: Dict[str, Any], outpath: str):
-        g = group.copy().reset_index(drop=True)
-        g["SE"] = g.apply(lambda r: se_from_ci(r["ci_low"], r["ci_high"]), axis=1)
-        g = g.dropna(subset=["SE", "estimate"])
+    def make_forest_plot(self, group: pd.DataFrame, pooled_row: Dict[str, Any], outpath: str, dpi: int = 150):
+        # matplotlib is imported on first plot only, so make_plots=False runs never load it.
+        # Figure + Agg-backed savefig needs no pyplot and no global backend switch.
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        # SE comes from build_effects; the CI bounds are plotted as stored
+        g = group.dropna(subset=["SE", "estimate", "ci_low", "ci_high"]).reset_index(drop=True)
 
         labels = g["study_id"].tolist()
-        ests = g["estimate"].values
-        ses = g["SE"].values
-        ci_l = ests - Z * ses
-        ci_u = ests + Z * ses
+        ests = g["estimate"].to_numpy()
+        ci_l = g["ci_low"].to_numpy()
+        ci_u = g["ci_high"].to_numpy()
 
-        plt.figure(figsize=(7, 0.45 * max(4, len(g) + 3)))
+        # a standalone Figure (no pyplot state), so plots can render in parallel threads
+        fig = Figure(figsize=(7, 0.45 * max(4, len(g) + 3)))
+        ax = fig.add_subplot()
         y = np.arange(len(g), 0, -1)
-        for i, (lo, hi, e) in enumerate(zip(ci_l, ci_u, ests)):
-            plt.hlines(y[i], lo, hi)
-            plt.plot(e, y[i], "o")
-        plt.axvline(pooled_row["pooled"], linestyle="--")
-        plt.fill_betweenx([0, len(g) + 1], pooled_row["ci_low"], pooled_row["ci_high"], alpha=0.15)
-        plt.yticks(y, labels, fontsize=8)
-        plt.xlabel("Effect (SMD, Hedges' g)")
-        plt.title(f"{group['outcome'].iloc[0]} — Random-effects (DL)")
-        plt.tight_layout()
-        plt.savefig(outpath, dpi=200)
-        plt.close()
+        # all CI bars as one collection and all point estimates as one scatter
+        segments = np.stack([np.column_stack([ci_l, y]), np.column_stack([ci_u, y])], axis=1)
+        ax.add_collection(LineCollection(segments, colors="k", linewidths=1))
+        ax.scatter(ests, y, marker="o", zorder=3)
+        ax.axvline(pooled_row["pooled"], linestyle="--")
+        ax.fill_betweenx([0, len(g) + 1], pooled_row["ci_low"], pooled_row["ci_high"], alpha=0.15)
+        ax.autoscale_view()
+        ax.set_yticks(y)
+        ax.set_yticklabels(labels, fontsize=8)
+        ax.set_xlabel("Effect (SMD, Hedges' g)")
+        ax.set_title(f"{group['outcome'].iloc[0]} — Random-effects (DL)")
+        fig.tight_layout()
+        # fast zlib level: PNG encode dominates batch plotting, file size barely changes
+        fig.savefig(outpath, dpi=dpi, pil_kwargs={"compress_level": 1, "optimize": False})
 
     def run(self, make_plots: bool = True):
-        print(f"Scanning JSONs in: {INPATH}")
-        print(f"Writing outputs to: {OUTDIR}")
-        paths = self.resolve_json_paths(INPATH)
-        if not paths:
+        print(f"Writing outputs to: {self.outdir}")
+        # paths resolved by the caller are reused as-is; only scan when none were given
+        if not self.json_paths:
+            print(f"Scanning JSONs in: {INPATH}")
+            self.json_paths = self.resolve_json_paths(INPATH)
+        if not self.json_paths:
             print("No JSONs found. Put your extractor JSONs into this folder.")
             return
-        print(f"Found {len(paths)} JSON files.")
-        self.json_paths = paths
+        print(f"Found {len(self.json_paths)} JSON files.")
 
         self.build_effects()
         self.save_tables()
         self.pool_groups(make_plots=make_plots)
 
 
+def _load_rows_or_error(path: str) -> Tuple[np.ndarray, Optional[Exception]]:
+    """Module-level (picklable) wrapper so one bad file never aborts a pool run."""
+    try:
+        return MetaAnalyzer.load_effect_rows(path), None
+    except Exception as e:
+        return np.empty(0, dtype=_ROW_DTYPE), e
+
+
 if __name__ == "__main__":
     INPATH = "extractor_output/"
     OUTDIR = "meta_output/"
@@ -334,5 +515,8 @@ if __name__ == "__main__":
 
     os.makedirs(OUTDIR, exist_ok=True)
 
-    analyzer = MetaAnalyzer(json_paths=[], outdir=OUTDIR, min_k=MIN_K)
+    # scan the input folder once; run() reuses this list instead of re-scanning
+    print(f"Scanning JSONs in: {INPATH}")
+    paths = MetaAnalyzer.resolve_json_paths(INPATH)
+    analyzer = MetaAnalyzer(json_paths=paths, outdir=OUTDIR, min_k=MIN_K)
     analyzer.run(make_plots=MAKE_PLOTS)
@@ -23,17 +23,26 @@ Challenge: HackAging.AI - Future of Evidence
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import os
+import re
+import shutil
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+from screening.src.cpus import available_cpus
+
 # Module imports
 try:
-    from search_agent import build_query, search_pubmed, fetch_metadata
+    from search_agent import build_query, search_pubmed, fetch_metadata, fetch_metadata_async, HAS_HTTPX
     from extractor import PDFLLMExtractor
 except ImportError as e:
     print(f"Error importing modules: {e}")
@@ -49,13 +58,15 @@ except ImportError:
     print("Warning: PrePico module not available (requires scispacy)")
     print("Protocol formulation from research questions will be limited.")
 
-# Try to import meta_analyzer (may need stub functions)
+# Try to import meta_analyzer (may need stub functions).
+# NOTE: meta_analyzer.py currently exposes the MetaAnalyzer class, not these
+# functions, so this stays False and Module 5 writes the basic summary only.
 HAS_META_ANALYZER = False
 try:
     import meta_analyzer
     # Check if required functions exist
-    if hasattr(meta_analyzer, 'load_jsons'):
-        from meta_analyzer import load_jsons, build_study_rows, pool_fixed_inv_var, make_forest
+    if hasattr(meta_analyzer, 'build_study_rows'):
+        from meta_analyzer import build_study_rows, make_forest
         HAS_META_ANALYZER = True
 except (ImportError, AttributeError):
     pass
@@ -64,6 +75,121 @@ if not HAS_META_ANALYZER:
     print("Warning: Meta-analyzer module incomplete")
     print("Module 5 (meta-analysis) will generate basic summaries only")
 
+# joblib is optional: on-disk memoization of PDF extraction across re-runs
+try:
+    import joblib
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
+# orjson is optional: faster JSON parsing and serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _iter_studies(paths):
+    """Yield parsed extraction JSONs one at a time instead of loading them all up front."""
+    for p in paths:
+        raw = Path(p).read_bytes()
+        if HAS_ORJSON:
+            try:
+                yield orjson.loads(raw)
+                continue
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN literals; stdlib json accepts them
+        yield json.loads(raw)
+
+
+def _dump(obj, path):
+    """Write obj as indented UTF-8 JSON; orjson also handles NumPy scalars/arrays."""
+    if HAS_ORJSON:
+        Path(path).write_bytes(orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _loads_line(line: bytes):
+    """Parse one JSONL line; orjson when installed, undecodable bytes replaced otherwise."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line.decode('utf-8', errors='replace'))
+
+
+# Numeric columns of build_study_rows output used by the Module 5 pooling
+_STUDY_DTYPES = {'effect': 'float64', 'se': 'float64'}
+
+
+_KW_SPLIT = re.compile(r'[,;\s]+')
+_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'of', 'with'})
+
+
+# Standalone token placed between texts so one split can be partitioned back per text
+_KW_SEP = "\x00"
+
+
+@lru_cache(maxsize=128)
+def _split_keywords(*texts: str) -> tuple:
+    """
+    Keywords for each of texts (split on common separators, minus stopwords,
+    top 10), from a single regex split over the sentinel-joined texts.
+    Cached since it is a pure function of its inputs.
+    """
+    groups, current = [], []
+    for w in _KW_SPLIT.split(f" {_KW_SEP} ".join(texts).lower()):
+        if w == _KW_SEP:
+            groups.append(tuple(current[:10]))
+            current = []
+        elif w and w not in _STOPWORDS:
+            current.append(w)
+    groups.append(tuple(current[:10]))
+    return tuple(groups)
+
+
+# One extractor per worker process, built on first use
+_WORKER_EXTRACTOR = None
+# joblib-cached wrapper around _extract_pdf, also one per worker process
+_WORKER_CACHED_EXTRACT = None
+
+
+def _extract_pdf(pdf_sha: str, question: str, pdf_path: str, debug: bool):
+    """Run the LLM extractor; the cache keys on (pdf_sha, question) only."""
+    global _WORKER_EXTRACTOR
+    if _WORKER_EXTRACTOR is None:
+        _WORKER_EXTRACTOR = PDFLLMExtractor(debug=debug)
+    return _WORKER_EXTRACTOR.extract(pdf_path, question)
+
+
+def _extract_one(study_id: str, pdf_path: str, question: str, debug: bool,
+                 cache_dir: Optional[str] = None):
+    """
+    Extract one PDF. Module-level so ProcessPoolExecutor can pickle it.
+
+    With joblib installed and a cache_dir, results are memoized on disk by
+    PDF content hash, so re-runs (or renamed PDFs) skip the LLM call.
+
+    Returns:
+        (study_id, result, error message or None)
+    """
+    global _WORKER_CACHED_EXTRACT
+    try:
+        if cache_dir and HAS_JOBLIB:
+            if _WORKER_CACHED_EXTRACT is None:
+                memory = joblib.Memory(location=cache_dir, verbose=0)
+                _WORKER_CACHED_EXTRACT = memory.cache(_extract_pdf, ignore=['pdf_path', 'debug'])
+            pdf_sha = hashlib.sha1(Path(pdf_path).read_bytes()).hexdigest()
+            return study_id, _WORKER_CACHED_EXTRACT(pdf_sha, question, pdf_path, debug), None
+        return study_id, _extract_pdf(None, question, pdf_path, debug), None
+    except Exception as e:
+        return study_id, None, str(e)
+
 
 class MetaAnalysisPipeline:
     """
@@ -94,6 +220,9 @@ class MetaAnalysisPipeline:
             d.mkdir(parents=True, exist_ok=True)
 
         self.log_file = self.output_dir / "pipeline.log"
+        # One buffered handle for the whole run; flushed at each step and on exit
+        self._logf = open(self.log_file, 'a', encoding='utf-8', errors='replace', buffering=1 << 16)
+        atexit.register(self._logf.close)
         self.start_time = time.time()
 
         self.log("="*70)
@@ -106,11 +235,11 @@ class MetaAnalysisPipeline:
     def log(self, message: str):
         """Log message to console and file (UTF-8 safe on Windows)."""
         print(message)
-        with open(self.log_file, 'a', encoding='utf-8', errors='replace') as f:
-            f.write(f"{message}\n")
+        self._logf.write(f"{message}\n")
 
     def step(self, step_num: int, description: str):
         """Log a pipeline step."""
+        self._logf.flush()
         self.log("")
         self.log(f"{'='*70}")
         self.log(f"STEP {step_num}: {description}")
@@ -134,9 +263,20 @@ class MetaAnalysisPipeline:
             with open(protocol_path, 'r', encoding='utf-8') as f:
                 protocol = json.load(f)
 
+            # Copy the file as-is; skip it when the output already holds these bytes
             output_path = self.protocol_dir / "protocol.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(protocol, f, indent=2)
+            src = Path(protocol_path)
+            if output_path.exists() and (
+                os.path.samefile(src, output_path) or (
+                    src.stat().st_size == output_path.stat().st_size
+                    and hashlib.sha1(src.read_bytes()).digest()
+                    == hashlib.sha1(output_path.read_bytes()).digest()
+                )
+            ):
+                self.log(f"✓ Protocol loaded (already up to date at: {output_path})")
+                return protocol
+
+            shutil.copy2(src, output_path)
 
             self.log(f"✓ Protocol loaded and saved to: {output_path}")
             return protocol
@@ -147,9 +287,21 @@ class MetaAnalysisPipeline:
         self.log(f"Research question: {question}")
 
         if HAS_PREPICO:
-            self.log("Extracting PICO elements with PrePico...")
-            extractor = PICOExtractor()
-            pico_result = extractor.extract_pico(question)
+            # PrePico output is cached on disk by question hash across re-runs
+            key = hashlib.sha1(question.strip().lower().encode("utf-8")).hexdigest()
+            cache_path = self.output_dir.parent / ".vv_cache" / f"{key}.json"
+            if cache_path.exists():
+                self.log(f"Using cached PICO elements: {cache_path}")
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    pico_result = json.load(f)
+            else:
+                self.log("Extracting PICO elements with PrePico...")
+                extractor = PICOExtractor()
+                pico_result = extractor.extract_pico(question)
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                _dump(pico_result, tmp_path)
+                os.replace(tmp_path, cache_path)
         else:
             self.log("PrePico not available - using simple extraction...")
             pico_result = self._simple_pico_extraction(question)
@@ -183,8 +335,7 @@ class MetaAnalysisPipeline:
 
         # Save protocol
         output_path = self.protocol_dir / "protocol.json"
-        with open(output_path, 'w') as f:
-            json.dump(protocol, f, indent=2)
+        _dump(protocol, output_path)
 
         self.log(f"✓ Protocol created and saved to: {output_path}")
         self.log(f"  Population: {protocol['pico']['population']}")
@@ -204,8 +355,6 @@ class MetaAnalysisPipeline:
         Returns:
             Dictionary with PICO elements
         """
-        import re
-
         # Basic patterns
         question_lower = question.lower()
 
@@ -265,25 +414,17 @@ class MetaAnalysisPipeline:
 
     def _generate_keywords(self, pico_result: Dict) -> Dict:
         """Generate search keywords from PICO elements."""
-        # Simple keyword extraction (can be enhanced)
-        return {
-            "population_terms": self._extract_keywords(pico_result.get("population", "")),
-            "intervention_terms": self._extract_keywords(pico_result.get("intervention", "")),
-            "outcome_terms": self._extract_keywords(pico_result.get("outcomes", []))
+        # Simple keyword extraction (can be enhanced); all free-text fields
+        # are tokenized in one pass, lists are kept as given
+        fields = {
+            "population_terms": pico_result.get("population", ""),
+            "intervention_terms": pico_result.get("intervention", ""),
+            "outcome_terms": pico_result.get("outcomes", [])
         }
-
-    def _extract_keywords(self, text) -> List[str]:
-        """Extract keywords from text."""
-        if isinstance(text, list):
-            return [str(item) for item in text]
-
-        # Basic keyword extraction (split on common separators)
-        import re
-        words = re.split(r'[,;\s]+', str(text).lower())
-        # Filter common stopwords
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}
-        keywords = [w.strip() for w in words if w.strip() and w.strip() not in stopwords]
-        return keywords[:10]  # Limit to top 10
+        texts = {k: str(v) for k, v in fields.items() if not isinstance(v, list)}
+        split = dict(zip(texts, _split_keywords(*texts.values())))
+        return {k: list(split[k]) if k in split else [str(item) for item in v]
+                for k, v in fields.items()}
 
     def run_module_2_search(self, protocol: Dict, max_results: int = 1000) -> List[str]:
         """
@@ -309,13 +450,27 @@ class MetaAnalysisPipeline:
 
         # Fetch metadata
         self.log("Fetching article metadata...")
-        metadata_list = fetch_metadata(pmids)
+        failures = []
+        if HAS_HTTPX:
+            metadata_list, failures = asyncio.run(fetch_metadata_async(pmids))
+        else:
+            metadata_list = fetch_metadata(pmids)
+        if failures:
+            # batches that failed after retries: log them and keep their PMIDs with the search output
+            failed_pmids = [pmid for batch, _ in failures for pmid in batch]
+            for batch, error in failures:
+                self.log(f"Warning: metadata batch {batch[0]}..{batch[-1]} ({len(batch)} PMIDs) failed: {error}")
+            failed_path = self.search_dir / "failed_pmids.txt"
+            failed_path.write_text("".join(f"{pmid}\n" for pmid in failed_pmids), encoding="utf-8")
+            self.log(f"Warning: no metadata for {len(failed_pmids)} PMIDs; listed in {failed_path}")
 
         # Save citations
         citations_path = self.search_dir / "citations.jsonl"
-        with open(citations_path, 'w', encoding='utf-8', errors='replace') as f:
-            for meta in metadata_list:
-                f.write(json.dumps(meta, ensure_ascii=False) + '\n')
+        with open(citations_path, 'w', encoding='utf-8', errors='replace', buffering=1 << 20) as f:
+            if HAS_ORJSON:
+                f.writelines(orjson.dumps(meta).decode('utf-8') + '\n' for meta in metadata_list)
+            else:
+                f.writelines(json.dumps(meta, ensure_ascii=False) + '\n' for meta in metadata_list)
 
         self.log(f"✓ Saved {len(metadata_list)} citations to: {citations_path}")
 
@@ -334,7 +489,6 @@ class MetaAnalysisPipeline:
         self.step(3, "Screening & Selection")
 
         # Copy protocol to screening data directory
-        import shutil
         protocol_path = self.protocol_dir / "protocol.json"
         screening_protocol = Path("screening/data/protocol.json")
         screening_protocol.parent.mkdir(parents=True, exist_ok=True)
@@ -347,51 +501,82 @@ class MetaAnalysisPipeline:
             shutil.copy(citations_src, citations_dst)
 
         self.log("Running Title/Abstract screening...")
-        import subprocess
+        included_ids = asyncio.run(self._run_screening_stages(protocol))
+
+        self.log(f"✓ Screening complete: {len(included_ids)} studies included")
+
+        return included_ids
+
+    def _run_stage(self, name: str, run, **kwargs):
+        """Run one screening CLI in-process; failures are logged, not raised."""
+        try:
+            return run(argparse.Namespace(**kwargs))
+        except Exception as e:
+            self.log(f"Warning: {name} failed: {e}")
+            return 1
+
+    async def _run_screening_stages(self, protocol: Dict) -> List[str]:
+        """
+        TA -> FT -> PRISMA run in order (each reads the previous output);
+        the flow diagram only needs prisma.json, so it renders while the
+        outputs are copied and the included IDs are read.
+        """
+        from screening.cli import ta_screen, ft_screen, make_prisma, make_plots
 
         # Run TA screening
-        result = subprocess.run([
-            "python3", "-m", "screening.cli.ta_screen",
-            "--citations", "screening/data/citations.jsonl",
-            "--protocol", "screening/data/protocol.json",
-            "--decisions", "screening/out/ta_decisions.jsonl",
-            "--classifications", "screening/out/classifications.jsonl",
-            "--topic", "resveratrol_t2d"
-        ], capture_output=True, text=True)
-
-        if result.returncode != 0:
-            self.log(f"Warning: TA screening returned code {result.returncode}")
-            if result.stderr:
-                self.log(f"Error: {result.stderr}")
+        self._run_stage(
+            "TA screening", ta_screen.run,
+            citations="screening/data/citations.jsonl",
+            protocol="screening/data/protocol.json",
+            decisions="screening/out/ta_decisions.jsonl",
+            classifications="screening/out/classifications.jsonl",
+            topic="resveratrol_t2d",
+            threshold=0.70,
+            cache=str(self.output_dir.parent / ".vv_cache" / "ta_scores.sqlite"),
+            workers=min(available_cpus(), 8),
+        )
 
         # Run FT screening
         self.log("Running Full-Text screening...")
-        result = subprocess.run([
-            "python3", "-m", "screening.cli.ft_screen",
-            "--ta", "screening/out/ta_decisions.jsonl",
-            "--protocol", "screening/data/protocol.json",
-            "--decisions", "screening/out/ft_decisions.jsonl"
-        ], capture_output=True, text=True)
+        self._run_stage(
+            "FT screening", ft_screen.run,
+            ta="screening/out/ta_decisions.jsonl",
+            protocol="screening/data/protocol.json",
+            decisions="screening/out/ft_decisions.jsonl",
+        )
 
         # Generate PRISMA
         self.log("Generating PRISMA statistics...")
-        result = subprocess.run([
-            "python3", "-m", "screening.cli.make_prisma",
-            "--ta", "screening/out/ta_decisions.jsonl",
-            "--ft", "screening/out/ft_decisions.jsonl",
-            "--out", "screening/out/prisma.json"
-        ], capture_output=True, text=True)
-
-        # Generate PRISMA flow diagram
+        self._run_stage(
+            "PRISMA statistics", make_prisma.run,
+            ta="screening/out/ta_decisions.jsonl",
+            ft="screening/out/ft_decisions.jsonl",
+            out="screening/out/prisma.json",
+        )
+
+        # Generate PRISMA flow diagram alongside the output collection
         self.log("Generating PRISMA flow diagram...")
-        result = subprocess.run([
-            "python3", "-m", "screening.cli.make_plots",
-            "--prisma", "screening/out/prisma.json",
-            "--output", str(self.screening_dir / "prisma_flow.png"),
-            "--title", protocol.get("title", "Systematic Review"),
-            "--dpi", "300"
-        ], capture_output=True, text=True)
+        loop = asyncio.get_running_loop()
+        _, included_ids = await asyncio.gather(
+            loop.run_in_executor(
+                None, lambda: self._run_stage(
+                    "PRISMA flow diagram", make_plots.run,
+                    prisma="screening/out/prisma.json",
+                    forest=None,
+                    output=str(self.screening_dir / "prisma_flow.png"),
+                    output_dir=None,
+                    title=protocol.get("title", "Systematic Review"),
+                    effect_measure="OR",
+                    dpi=300,
+                    format="png",
+                )
+            ),
+            loop.run_in_executor(None, self._collect_screening_outputs),
+        )
+        return included_ids
 
+    def _collect_screening_outputs(self) -> List[str]:
+        """Copy screening outputs into the run directory and return included study IDs."""
         # Copy outputs
         for file in ["ta_decisions.jsonl", "ft_decisions.jsonl", "prisma.json", "classifications.jsonl"]:
             src = Path(f"screening/out/{file}")
@@ -402,14 +587,15 @@ class MetaAnalysisPipeline:
         included_ids = []
         ft_decisions = self.screening_dir / "ft_decisions.jsonl"
         if ft_decisions.exists():
-            with open(ft_decisions, encoding='utf-8', errors='replace') as f:
+            # Byte prefilter: only lines mentioning "include" are worth parsing
+            with open(ft_decisions, 'rb') as f:
                 for line in f:
-                    record = json.loads(line)
+                    if b'"include"' not in line:
+                        continue
+                    record = _loads_line(line)
                     if record.get("decision") == "include":
                         included_ids.append(record["id"])
 
-        self.log(f"✓ Screening complete: {len(included_ids)} studies included")
-
         return included_ids
 
     def run_module_4_extraction(self, included_ids: List[str], question: str) -> List[str]:
@@ -428,9 +614,6 @@ class MetaAnalysisPipeline:
         self.log(f"Extracting data from {len(included_ids)} studies...")
         self.log("NOTE: This requires PDF files in ./pdfs/ directory")
 
-        # Initialize extractor
-        extractor = PDFLLMExtractor(debug=self.debug)
-
         extraction_files = []
         pdf_dir = Path("pdfs")
 
@@ -438,34 +621,77 @@ class MetaAnalysisPipeline:
             self.log("Warning: pdfs/ directory not found. Skipping extraction.")
             return []
 
+        # Index pdfs/ once (glob semantics: no dot-files), then resolve each study
+        pdf_index = {}
+        with os.scandir(pdf_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf") and not entry.name.startswith("."):
+                    pdf_index[entry.name] = entry.path
+
+        # Resolve PDFs up front, then extract them in parallel
+        work = []
         for study_id in included_ids:
-            # Find PDF file
-            pdf_files = list(pdf_dir.glob(f"*{study_id}*.pdf"))
-            if not pdf_files:
+            pdf_path = pdf_index.get(f"{study_id}.pdf")
+            if pdf_path is None:
+                pdf_path = next((p for name, p in pdf_index.items() if study_id in name), None)
+            if pdf_path is None:
                 self.log(f"  Warning: No PDF found for {study_id}")
                 continue
+            work.append((study_id, pdf_path))
+
+        cache_dir = str(self.output_dir.parent / ".vv_cache" / "extract")
+        if len(work) <= 1:
+            for sid, path in work:
+                self.log(f"  Processing: {Path(path).name}")
+                self._save_extractions([_extract_one(sid, path, question, self.debug, cache_dir)],
+                                       extraction_files)
+        else:
+            workers = min(available_cpus(), 8)
+            self.log(f"  Using {workers} worker processes")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                outcomes = self._extract_bounded(ex, work, question, cache_dir, max_inflight=2 * workers)
+                self._save_extractions(outcomes, extraction_files)
 
-            pdf_path = pdf_files[0]
-            self.log(f"  Processing: {pdf_path.name}")
-
-            try:
-                # Extract data
-                result = extractor.extract(str(pdf_path), question)
-
-                # Save extraction
-                output_file = self.extraction_dir / f"{study_id}.json"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+        self.log(f"✓ Extraction complete: {len(extraction_files)} files")
 
-                extraction_files.append(str(output_file))
-                self.log(f"    ✓ Saved to: {output_file.name}")
+        return extraction_files
 
-            except Exception as e:
-                self.log(f"    ✗ Error: {str(e)}")
+    def _extract_bounded(self, ex, work, question: str, cache_dir: str, max_inflight: int):
+        """
+        Yield _extract_one results as they finish, keeping at most max_inflight
+        futures submitted so finished-but-unsaved payloads cannot pile up.
+        """
+        pending = iter(work)
+        inflight = set()
+
+        def submit_next():
+            item = next(pending, None)
+            if item is not None:
+                sid, path = item
+                self.log(f"  Processing: {Path(path).name}")
+                inflight.add(ex.submit(_extract_one, sid, path, question, self.debug, cache_dir))
+
+        for _ in range(max_inflight):
+            submit_next()
+        while inflight:
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                inflight.discard(future)
+                yield future.result()
+                submit_next()
+
+    def _save_extractions(self, outcomes, extraction_files: List[str]):
+        """Write (study_id, result, error) tuples from _extract_one; main process only."""
+        for study_id, result, error in outcomes:
+            if error is not None:
+                self.log(f"    ✗ Error ({study_id}): {error}")
+                continue
 
-        self.log(f"✓ Extraction complete: {len(extraction_files)} files")
+            output_file = self.extraction_dir / f"{study_id}.json"
+            _dump(result, output_file)
 
-        return extraction_files
+            extraction_files.append(str(output_file))
+            self.log(f"    ✓ Saved to: {output_file.name}")
 
     def run_module_5_analysis(self, extraction_dir: Path) -> Dict:
         """
@@ -492,7 +718,7 @@ class MetaAnalysisPipeline:
             return {"note": "Meta-analysis module incomplete - see extracted data in extraction_dir"}
 
         self.log(f"Loading {len(json_files)} extraction files...")
-        studies = load_jsons([str(f) for f in json_files])
+        studies = _iter_studies(json_files)
 
         # Build study rows
         self.log("Building study data rows...")
@@ -506,34 +732,75 @@ class MetaAnalysisPipeline:
         self.log("Performing meta-analysis...")
         results = {}
 
+        import numpy as np
         import pandas as pd
-        df = pd.DataFrame(rows)
-
-        # Group by outcome and type
-        for (outcome, etype), grp in df.groupby(['outcome', 'type']):
-            if len(grp) < 2:
-                self.log(f"  Skipping {outcome} ({etype}): only {len(grp)} study")
-                continue
-
+        # Known numeric columns get their dtype up front instead of inferred per column
+        df = pd.DataFrame.from_records(rows).astype(_STUDY_DTYPES, copy=False)
+
+        # Drop single-study groups before any per-group work; only row positions
+        # are kept, so sub-frames are built just for the groups that get pooled
+        by_group = df.groupby(['outcome', 'type'], sort=False, observed=True)
+        sizes = by_group.size()
+        for outcome, etype in sizes.index[sizes < 2]:
+            self.log(f"  Skipping {outcome} ({etype}): only 1 study")
+        group_rows = by_group.indices
+
+        # Fixed-effect inverse-variance pooling for every group at once: per-row
+        # terms summed per group id. Cochran's Q is taken from residuals about the
+        # pooled mean (second pass), not sum(wx^2) - sum(wx)^2/sum(w), which cancels.
+        gid = by_group.ngroup()
+        in_group = gid.notna().to_numpy()  # rows with a missing key belong to no group (NaN id)
+        gid = gid.to_numpy()[in_group].astype(np.intp)
+        n = len(sizes)
+        k = sizes.to_numpy()
+        y = df['effect'].to_numpy()[in_group]
+        w = 1.0 / df['se'].to_numpy()[in_group] ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sum_w = np.bincount(gid, w, n)
+            pooled = np.bincount(gid, w * y, n) / sum_w
+            se = np.sqrt(1.0 / sum_w)
+            q = np.bincount(gid, w * (y - pooled[gid]) ** 2, n)
+            i_squared = np.where(q > 0, np.maximum(0.0, (q - (k - 1)) / q) * 100.0, 0.0)
+        plot_tasks = []
+
+        for pos in np.flatnonzero(k >= 2):
+            outcome, etype = sizes.index[pos]
+            grp = df.iloc[group_rows[(outcome, etype)]]
             self.log(f"  Analyzing {outcome} ({etype}): {len(grp)} studies")
 
-            # Perform fixed-effect meta-analysis
-            pooled_result = pool_fixed_inv_var(grp)
+            pooled_result = {
+                "pooled_effect": float(pooled[pos]),
+                "se": float(se[pos]),
+                "ci_lower": float(pooled[pos] - 1.96 * se[pos]),
+                "ci_upper": float(pooled[pos] + 1.96 * se[pos]),
+                "k": int(k[pos]),
+                "i_squared": float(i_squared[pos]),
+            }
             results[f"{outcome}_{etype}"] = pooled_result
 
-            # Generate forest plot
+            # Queue forest plot
             plot_path = self.analysis_dir / f"forest_{outcome}_{etype}.png"
-            make_forest(grp, pooled_result, str(plot_path),
-                       title=f"{outcome} ({etype})")
+            plot_tasks.append((grp, pooled_result, str(plot_path), f"{outcome} ({etype})"))
 
             self.log(f"    Pooled effect: {pooled_result['pooled_effect']:.3f} "
                     f"[{pooled_result['ci_lower']:.3f}, {pooled_result['ci_upper']:.3f}]")
-            self.log(f"    Forest plot saved: {plot_path.name}")
+
+        # Render forest plots; threads overlap PNG encoding and disk writes.
+        # Only with the non-interactive Agg backend, which is safe to use off the main thread.
+        import matplotlib
+        render = lambda t: make_forest(t[0], t[1], t[2], title=t[3])
+        if len(plot_tasks) > 1 and matplotlib.get_backend().lower() == 'agg':
+            with ThreadPoolExecutor(max_workers=min(4, available_cpus())) as ex:
+                list(ex.map(render, plot_tasks))
+        else:
+            for task in plot_tasks:
+                render(task)
+        for task in plot_tasks:
+            self.log(f"  Forest plot saved: {Path(task[2]).name}")
 
         # Save results summary
         summary_path = self.analysis_dir / "meta_analysis_results.json"
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        _dump(results, summary_path)
 
         self.log(f"✓ Meta-analysis complete: {len(results)} outcomes analyzed")
         self.log(f"  Results saved to: {summary_path}")
@@ -1,14 +1,10 @@
 import argparse, json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
-from screening.src.ft_eligibility import check_fulltext
-from screening.src.decisions import append_decision
-
-
-def load_jsonl(path):
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                yield json.loads(line)
+from screening.src.ft_eligibility import fulltext_features, score_fulltext
+from screening.src.decisions import append_decisions_bulk
+from screening.src.jsonl import load_jsonl
+from screening.src.cpus import env_int
 
 
 def main():
@@ -16,26 +12,35 @@ def main():
     ap.add_argument("--ta", required=True, help="TA decisions jsonl")
     ap.add_argument("--protocol", required=True)
     ap.add_argument("--decisions", required=True, help="append here fulltext decisions")
-    args = ap.parse_args()
+    run(ap.parse_args())
+
 
+def run(args):
     with open(args.protocol, "r", encoding="utf-8") as f:
         protocol: Dict = json.load(f)
 
     # Only process items marked include/maybe from TA
-    for r in load_jsonl(args.ta):
-        if r.get("stage") != "ta":
-            continue
-        if r.get("decision") not in {"include","maybe"}:
-            continue
-        sid = r["id"]
-        res = check_fulltext(sid, protocol)
-        append_decision(args.decisions, {
-            "id": sid,
-            "stage": "fulltext",
-            "decision": "include" if res["include"] else "exclude",
-            "reason": res.get("reason","unknown"),
-            "score": res.get("score",0.0)
-        })
+    sids = [r["id"] for r in load_jsonl(args.ta)
+            if r.get("stage") == "ta" and r.get("decision") in {"include","maybe"}]
+
+    # Feature extraction is I/O-bound (full-text retrieval), so fan out over threads;
+    # max_workers also caps concurrent requests to the full-text source.
+    # Scoring then runs once over all studies, in TA order.
+    workers = env_int("FT_CONCURRENCY", 16)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        features = list(ex.map(lambda sid: fulltext_features(sid, protocol), sids))
+    results = score_fulltext(features)
+
+    # Decisions are written once from this thread
+    decisions = [{
+        "id": sid,
+        "stage": "fulltext",
+        "decision": "include" if res["include"] else "exclude",
+        "reason": res.get("reason","unknown"),
+        "score": res.get("score",0.0)
+    } for sid, res in zip(sids, results)]
+
+    append_decisions_bulk(args.decisions, decisions)
 
 if __name__ == "__main__":
     main()
@@ -30,10 +30,9 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.visualizations import (
+# package import, like the other screening CLIs: run() also executes inside the
+# pipeline process, where a sys.path entry would shadow any top-level `src`
+from screening.src.visualizations import (
     create_prisma_flow_diagram,
     create_forest_plot,
     check_dependencies
@@ -127,12 +126,6 @@ Examples:
 
     args = parser.parse_args()
 
-    # Check dependencies
-    if not check_dependencies():
-        print("Error: matplotlib is required for plot generation")
-        print("Install with: pip install matplotlib")
-        sys.exit(1)
-
     # Validate inputs
     if not args.prisma and not args.forest:
         print("Error: Must provide at least --prisma or --forest")
@@ -144,6 +137,22 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
+    sys.exit(run(args))
+
+
+def run(args) -> int:
+    """
+    Generate the requested plots from parsed arguments.
+
+    Returns:
+        0 on success, 1 on error (so in-process callers are not exited)
+    """
+    # Check dependencies
+    if not check_dependencies():
+        print("Error: matplotlib is required for plot generation")
+        print("Install with: pip install matplotlib")
+        return 1
+
     # Determine output paths
     if args.output_dir:
         output_dir = Path(args.output_dir)
@@ -176,7 +185,7 @@ Examples:
         if "studies" not in forest_data:
             print("Warning: Forest plot data missing 'studies' key")
             print("Expected format: {\"studies\": [...], \"pooled\": {...}}")
-            sys.exit(1)
+            return 1
 
         study_data = forest_data["studies"]
 
@@ -206,6 +215,8 @@ Examples:
     if args.forest:
         print(f"Forest plot: {forest_output}")
 
+    return 0
+
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,30 @@
 import argparse, json
 from screening.src.prisma_counts import make_prisma
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--ta", required=True)
     ap.add_argument("--ft", required=False)
     ap.add_argument("--out", required=True)
-    args = ap.parse_args()
+    run(ap.parse_args())
+
 
+def run(args):
     prisma = make_prisma(args.ta, args.ft)
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(prisma, f, ensure_ascii=False, indent=2)
+    if HAS_ORJSON:
+        with open(args.out, "wb") as f:
+            # reason keys can be None; stdlib json coerces those to "null" too
+            f.write(orjson.dumps(prisma, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(prisma, f, ensure_ascii=False, indent=2)
     print(f"Wrote PRISMA counters to {args.out}")
 
 if __name__ == "__main__":
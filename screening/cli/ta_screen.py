@@ -1,16 +1,79 @@
-import argparse, json, os
+import argparse, json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain, islice
 from typing import Dict
 from screening.src.kw_rules import TOPIC_PACKS
 from screening.src.classifier import TAClassifier
-from screening.src.taxonomy import classify_article, classify_datatypes
-from screening.src.decisions import append_decision
+from screening.src.taxonomy import DataTypeMatcher, classify_article, classify_datatypes
+from screening.src.decisions import DecisionLog
+from screening.src.cache import ScoreCache
+from screening.src.cpus import available_cpus, env_int
+from screening.src.jsonl import load_jsonl, dumps_line
 
 
-def load_jsonl(path):
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                yield json.loads(line)
+# records scored per TAClassifier.score_batch call
+BATCH = 512
+# bump when scoring/classification logic changes so cached results are not reused
+CACHE_VERSION = 1
+
+
+# per-process state for process_batch, set by _init_worker
+_PACK = None
+_CLF = None
+_PROTOCOL = None
+_DATATYPES = None
+
+
+def iter_batches(it, size):
+    it = iter(it)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _init_worker(topic: str, clf: TAClassifier, protocol: Dict):
+    # runs once per worker: the (possibly fitted) classifier is unpickled here, not per batch
+    global _PACK, _CLF, _PROTOCOL, _DATATYPES
+    _PACK, _CLF, _PROTOCOL = TOPIC_PACKS[topic], clf, protocol
+    _DATATYPES = DataTypeMatcher(protocol)
+
+
+def process_batch(batch):
+    """(score, rule hits, classification, data types) per record, in batch order."""
+    out = []
+    for rec, p in zip(batch, _CLF.score_batch(batch)):
+        title, abstract = rec.get("title",""), rec.get("abstract","")
+        # lowercased once; shared by the rules and both classifiers
+        text = title + "\n" + abstract
+        text_lower = text.lower()
+        rule_hits = []
+        pos_hit, neg_hit, design_hit = _PACK.hits(text, text_lower)
+        if pos_hit: rule_hits.append("kw_pos")
+        if design_hit: rule_hits.append("kw_design")
+        if neg_hit: rule_hits.append("kw_neg")
+
+        # Automated classification (article type / design / species / data types)
+        auto = classify_article(title, abstract, text_lower)
+        data_type = classify_datatypes(_PROTOCOL, title, abstract, text_lower, matcher=_DATATYPES)
+        out.append((float(p), rule_hits, auto, data_type))
+    return out
+
+
+def _ordered_map(ex, fn, items, max_inflight):
+    """ex.map without submitting every item up front; yields (item, fn(item)) in input order."""
+    pending = deque()
+    for item in items:
+        pending.append((item, ex.submit(fn, item[-1])))
+        if len(pending) >= max_inflight:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
 
 
 def main():
@@ -21,8 +84,13 @@ def main():
     ap.add_argument("--classifications", required=True)
     ap.add_argument("--topic", default="resveratrol_t2d", choices=list(TOPIC_PACKS.keys()))
     ap.add_argument("--threshold", type=float, default=0.70)
-    args = ap.parse_args()
+    ap.add_argument("--cache", default=None, help="sqlite file caching scores by text hash")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="scoring processes (1 = in-process; default $TA_WORKERS, else available CPUs)")
+    run(ap.parse_args())
 
+
+def run(args):
     with open(args.protocol, "r", encoding="utf-8") as f:
         protocol: Dict = json.load(f)
 
@@ -32,40 +100,78 @@ def main():
     # Optional: if you have seed labels, train here. For hackathon MVP, skip training.
     # (You can later add a small labeled set and call clf.train(records, labels))
 
-    # classification output log
-    cls_f = open(args.classifications, "w", encoding="utf-8")
+    # pool, cache and output files are all released on error too: run() also executes
+    # inside the pipeline process
+    with ExitStack() as stack:
+        # Optional persistent cache of (score, rule hits, classification) by text hash;
+        # the version covers everything those results depend on
+        cache = None
+        if args.cache:
+            cache = stack.enter_context(ScoreCache(args.cache, "|".join([
+                str(CACHE_VERSION), args.topic,
+                pack.POS_RE.pattern, pack.NEG_RE.pattern, pack.DESIGN_RE.pattern,
+                json.dumps(protocol.get("taxonomy", {}), sort_keys=True),
+                "model" if clf.model is not None else "heuristic",
+            ])))
 
-    for rec in load_jsonl(args.citations):
-        tid = rec["id"]
-        text = (rec.get("title","") + "\n" + rec.get("abstract",""))
-        rule_hits = []
-        if pack.pos(text): rule_hits.append("kw_pos")
-        if pack.design_hit(text): rule_hits.append("kw_design")
-        if pack.neg(text): rule_hits.append("kw_neg")
-
-        p = clf.score(rec)
-        if ("kw_neg" in rule_hits) and p < 0.5:
-            decision, reason = "exclude", "negative_rule"
-        elif p >= clf.threshold:
-            decision, reason = "include", "ml_high"
-        elif p >= 0.5:
-            decision, reason = "maybe", "ml_mid"
+        def prepared(batches):
+            # (batch, cache keys, cached results, records still to score); parent process only
+            for batch in batches:
+                keys = [cache.key(r.get("title",""), r.get("abstract","")) for r in batch] if cache else [None] * len(batch)
+                cached = cache.get_many(keys) if cache else {}
+                yield batch, keys, cached, [r for r, k in zip(batch, keys) if k not in cached]
+
+        batches = iter_batches(load_jsonl(args.citations), BATCH)
+        first = next(batches, [])
+        batches = prepared(chain([first], batches))
+        # worker processes for scoring/classification; inputs of a single batch stay in-process
+        workers = args.workers or env_int("TA_WORKERS", available_cpus())
+        if workers > 1 and len(first) == BATCH:
+            ex = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(args.topic, clf, protocol)))
+            scored = _ordered_map(ex, process_batch, batches, max_inflight=2 * workers)
         else:
-            decision, reason = "exclude", "ml_low"
+            _init_worker(args.topic, clf, protocol)
+            scored = ((item, process_batch(item[-1])) for item in batches)
 
-        append_decision(args.decisions, {
-            "id": tid, "stage": "ta", "decision": decision,
-            "reason": reason, "score": round(float(p),4),
-            "threshold": clf.threshold, "rules": rule_hits
-        })
+        # classification output log: bytes lines, 1 MiB buffer.
+        # Workers only compute; all writes happen here, in input order.
+        dlog = stack.enter_context(DecisionLog(args.decisions))
+        cls_f = stack.enter_context(open(args.classifications, "wb", buffering=1 << 20))
 
-        # Automated classification (article type / design / species / data types)
-        auto = classify_article(rec.get("title",""), rec.get("abstract",""))
-        auto["id"] = tid
-        auto["data_type"] = classify_datatypes(protocol, rec.get("title",""), rec.get("abstract",""))
-        cls_f.write(json.dumps(auto, ensure_ascii=False) + "\n")
+        for (batch, keys, cached, _), results in scored:
+            results = iter(results)
+            fresh = []
+            for rec, key in zip(batch, keys):
+                tid = rec["id"]
+                if key in cached:
+                    p, rule_hits, auto, data_type = cached[key]
+                else:
+                    p, rule_hits, auto, data_type = next(results)
+                    if cache:
+                        fresh.append((key, (p, rule_hits, auto, data_type)))
+
+                if ("kw_neg" in rule_hits) and p < 0.5:
+                    decision, reason = "exclude", "negative_rule"
+                elif p >= clf.threshold:
+                    decision, reason = "include", "ml_high"
+                elif p >= 0.5:
+                    decision, reason = "maybe", "ml_mid"
+                else:
+                    decision, reason = "exclude", "ml_low"
+
+                dlog.append({
+                    "id": tid, "stage": "ta", "decision": decision,
+                    "reason": reason, "score": round(float(p),4),
+                    "threshold": clf.threshold, "rules": rule_hits
+                })
 
-    cls_f.close()
+                auto = dict(auto)
+                auto["id"] = tid
+                auto["data_type"] = data_type
+                cls_f.write(dumps_line(auto))
+            if cache:
+                cache.put_many(fresh)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,46 @@
+"""Persistent cache of per-citation TA screening results, keyed by text hash.
+Backed by sqlite3 (stdlib); values are zlib-compressed pickles.
+The version string is hashed into every key, so changing rules or models
+simply stops old entries from matching.
+"""
+import hashlib, os, pickle, sqlite3, zlib
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class ScoreCache:
+    def __init__(self, path: str, version: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS scores (k BLOB PRIMARY KEY, v BLOB)")
+        self.version = version.encode("utf-8")
+
+    def key(self, title: str, abstract: str) -> bytes:
+        h = hashlib.sha256(self.version)
+        h.update(b"\0")
+        h.update(f"{title}\n{abstract}".encode("utf-8"))
+        return h.digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, Any]:
+        out = {}
+        keys = list(set(keys))
+        for i in range(0, len(keys), 500):  # stay under sqlite's bound-parameter limit
+            chunk = keys[i:i+500]
+            q = "SELECT k, v FROM scores WHERE k IN (%s)" % ",".join("?" * len(chunk))
+            for k, v in self.conn.execute(q, chunk):
+                out[bytes(k)] = pickle.loads(zlib.decompress(v))
+        return out
+
+    def put_many(self, items: Iterable[Tuple[bytes, Any]]):
+        rows = [(k, zlib.compress(pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL))) for k, v in items]
+        if rows:
+            self.conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?)", rows)
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
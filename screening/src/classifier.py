@@ -1,12 +1,46 @@
 import json, re
 from typing import List, Tuple
+import numpy as np
 from . import embedder
 
+_TRIAL_RE = re.compile(r"randomi[sz]ed|trial|placebo")
+
+def _fold_weights(model):
+    """Stacked weights of a sigmoid-calibrated LogisticRegression ensemble, or None.
+
+    Returns (W, intercept, a, b), one column/entry per CV fold: W is
+    (n_features, n_folds) float64, and a, b are the Platt parameters
+    applied to that fold's decision function.
+    """
+    cols, intercept, a, b = [], [], [], []
+    for cc in getattr(model, "calibrated_classifiers_", []):
+        lr = getattr(cc, "estimator", None) or getattr(cc, "base_estimator", None)
+        cal = cc.calibrators[0] if len(getattr(cc, "calibrators", [])) == 1 else None
+        if lr is None or not hasattr(lr, "coef_") or lr.coef_.shape[0] != 1 or not hasattr(cal, "a_"):
+            return None  # multiclass / isotonic / other estimators: keep the float path
+        cols.append(np.asarray(lr.coef_[0], dtype=np.float64))
+        intercept.append(float(lr.intercept_[0]))
+        a.append(float(cal.a_)); b.append(float(cal.b_))
+    if not cols:
+        return None
+    return np.stack(cols, axis=1), np.array(intercept), np.array(a), np.array(b)
+
+
 class TAClassifier:
     def __init__(self):
         self.model = None
         self.vectorizer = None
         self.threshold = 0.70
+        self._folds = None
+        self._bind()
+
+    def _bind(self):
+        # pick the scoring path once (after __init__ / train), not per record
+        if self.model is None:
+            self._score_impl = self._score_heuristic
+            return
+        self._transform = self.vectorizer.transform if hasattr(self.vectorizer, "transform") else embedder.encode
+        self._score_impl = self._score_model
 
     def train(self, records: List[dict], labels: List[int]):
         # records must contain title+abstract
@@ -19,24 +53,44 @@ class TAClassifier:
             base = LogisticRegression(max_iter=500)
             self.model = CalibratedClassifierCV(base)
             self.model.fit(X, labels)
+            self._folds = _fold_weights(self.model)
         except Exception:
             # super-lightweight fallback: keyword prior only
             self.model = None
             self.vectorizer = None
+            self._folds = None
         self.vectorizer = embedder.load()
+        self._bind()
 
-    def score(self, rec: dict) -> float:
-        text = f"{rec.get('title','')} [SEP] {rec.get('abstract','')}"
-        if self.model is not None:
-            if hasattr(self.vectorizer, "transform"):
-                X = self.vectorizer.transform([text])
-            else:
-                X = self.vectorizer.encode([text])
-            p = float(self.model.predict_proba(X)[0,1])
-            return p
+    def _predict(self, X) -> np.ndarray:
+        """P(include) per row of X from the trained model."""
+        if self._folds is None:
+            return np.asarray(self.model.predict_proba(X)[:,1], dtype=float)
+        W, intercept, a, b = self._folds
+        # one product for all folds instead of one decision_function per fold
+        logits = np.asarray(X @ W) + intercept
+        # Platt sigmoid per fold, averaged like CalibratedClassifierCV(ensemble=True)
+        return (1.0 / (1.0 + np.exp(a * logits + b))).mean(axis=1)
+
+    def _score_model(self, texts: List[str]) -> np.ndarray:
+        return self._predict(self._transform(texts))
+
+    @staticmethod
+    def _score_heuristic(texts: List[str]) -> np.ndarray:
         # no model: simple heuristic
-        s = text.lower()
-        p = 0.5
-        p += 0.2 if re.search(r"randomi[sz]ed|trial|placebo", s) else 0
-        p += 0.2 if len(s) > 200 else 0
-        return max(0.0, min(1.0, p))
+        lowered = [t.lower() for t in texts]
+        hit = np.fromiter((_TRIAL_RE.search(s) is not None for s in lowered), dtype=bool, count=len(lowered))
+        long_ = np.fromiter((len(s) for s in lowered), dtype=np.int64, count=len(lowered)) > 200
+        p = 0.5 + np.where(hit, 0.2, 0.0)
+        p = p + np.where(long_, 0.2, 0.0)
+        return np.clip(p, 0.0, 1.0)
+
+    def score(self, rec: dict) -> float:
+        return float(self._score_impl([f"{rec.get('title','')} [SEP] {rec.get('abstract','')}"])[0])
+
+    def score_batch(self, recs: List[dict]) -> np.ndarray:
+        """Same as score() for many records: one transform + one predict."""
+        texts = [f"{r.get('title','')} [SEP] {r.get('abstract','')}" for r in recs]
+        if not texts:
+            return np.zeros(0)
+        return self._score_impl(texts)
@@ -1,20 +1,77 @@
 """Contract-only client for Module 4 / ingestion.
 Replace stubs with real HTTP/RPC calls provided by Dmitry's module.
+
+Set VV_INGESTION_DB to a sqlite file to keep registered full texts and
+metadata on disk, shared by worker processes/threads and across runs;
+otherwise they live in per-process dicts.
 """
+import json, os, sqlite3, threading
 from typing import Dict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+DB_PATH = os.environ.get("VV_INGESTION_DB")
+
 # Simple in-memory stubs you can swap out.
 _FAKE_FULLTEXT = {}
 _FAKE_META = {}
 
+# one sqlite connection per thread (and per process after fork)
+_local = threading.local()
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if HAS_ORJSON else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.pid != os.getpid():
+        os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer
+        conn.execute("CREATE TABLE IF NOT EXISTS fulltext (id TEXT PRIMARY KEY, v BLOB)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (id TEXT PRIMARY KEY, v BLOB)")
+        _local.conn, _local.pid = conn, os.getpid()
+    return conn
+
+
+def _put(table: str, study_id: str, value):
+    conn = _conn()
+    with conn:
+        conn.execute(f"INSERT OR REPLACE INTO {table} VALUES (?, ?)", (study_id, _dumps(value)))
+
+
+def _get(table: str, study_id: str):
+    row = _conn().execute(f"SELECT v FROM {table} WHERE id = ?", (study_id,)).fetchone()
+    return None if row is None else _loads(row[0])
+
+
 def register_fulltext(study_id: str, sections: Dict):
-    _FAKE_FULLTEXT[study_id] = {"id": study_id, "sections": sections}
+    doc = {"id": study_id, "sections": sections}
+    if DB_PATH:
+        _put("fulltext", study_id, doc)
+    else:
+        _FAKE_FULLTEXT[study_id] = doc
 
 def register_metadata(study_id: str, meta: Dict):
-    _FAKE_META[study_id] = meta
+    if DB_PATH:
+        _put("meta", study_id, meta)
+    else:
+        _FAKE_META[study_id] = meta
 
 def get_fulltext_text(study_id: str) -> Dict:
-    return _FAKE_FULLTEXT.get(study_id, {"status":"unavailable"})
+    doc = _get("fulltext", study_id) if DB_PATH else _FAKE_FULLTEXT.get(study_id)
+    return doc if doc is not None else {"status":"unavailable"}
 
 def get_metadata(study_id: str) -> Dict:
-    return _FAKE_META.get(study_id, {})
+    meta = _get("meta", study_id) if DB_PATH else _FAKE_META.get(study_id)
+    return meta if meta is not None else {}
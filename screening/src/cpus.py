@@ -0,0 +1,32 @@
+"""Worker-count helpers shared by the pipeline, the screening CLIs and meta_analyzer.
+VV_MAX_WORKERS overrides the detected CPU count; per-tool variables (TA_WORKERS, FT_CONCURRENCY) are read via env_int.
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Integer from environment variable `name`; unset, unparsable or < minimum falls back to default."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not an integer, using %d", name, raw, default)
+        return default
+    if value < minimum:
+        logger.warning("Ignoring %s=%d: must be >= %d, using %d", name, value, minimum, default)
+        return default
+    return value
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (cgroup/affinity aware); VV_MAX_WORKERS overrides."""
+    if hasattr(os, "sched_getaffinity"):
+        n = len(os.sched_getaffinity(0))
+    else:
+        n = os.cpu_count() or 1
+    return env_int("VV_MAX_WORKERS", n)
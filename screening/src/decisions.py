@@ -1,11 +1,56 @@
 import json, time
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 def _ts():
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
+def _dumps(rec: Dict[str, Any]) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(rec).decode("utf-8")
+    return json.dumps(rec, ensure_ascii=False)
+
+class DecisionLog:
+    """Append-only decisions JSONL kept open (1 MiB buffer) for the whole run."""
+
+    def __init__(self, path: str):
+        self.f = open(path, "a", encoding="utf-8", buffering=1 << 20)
+        self._sec = None
+        self._stamp = None
+
+    def _now(self) -> str:
+        # timestamps have 1 s resolution: format once per second, not per record
+        sec = int(time.time())
+        if sec != self._sec:
+            self._sec, self._stamp = sec, _ts()
+        return self._stamp
+
+    def append(self, rec: Dict[str, Any]):
+        rec = dict(rec)
+        rec.setdefault("ts", self._now())
+        self.f.write(_dumps(rec))
+        self.f.write("\n")
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 def append_decision(path: str, rec: Dict[str, Any]):
-    rec = dict(rec)
-    rec.setdefault("ts", _ts())
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    with DecisionLog(path) as log:
+        log.append(rec)
+
+def append_decisions_bulk(path: str, recs: Iterable[Dict[str, Any]]):
+    """Append many decisions with a single open and one buffered write pass."""
+    with DecisionLog(path) as log:
+        for rec in recs:
+            log.append(rec)
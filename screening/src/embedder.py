@@ -1,37 +1,70 @@
 """Embeddings with a graceful fallback.
-Uses sentence-transformers if available; else TF-IDF.
+Uses sentence-transformers if available; else TF-IDF over hashed n-grams.
 Toggle via env USE_EMBEDDINGS=true|false
+Sentence embeddings run on CUDA in fp16 when available; EMB_BATCH_SIZE sets the encode batch.
 """
 import os
 from typing import List
+from screening.src.cpus import available_cpus
 
 _USE_EMB = os.getenv("USE_EMBEDDINGS", "false").lower() in {"1","true","yes"}
+_BATCH_SIZE = int(os.getenv("EMB_BATCH_SIZE", "256"))
 
 _vec = None
 
+# hashing is stateless, so big inputs are tokenized in parallel chunks
+PARALLEL_MIN_TEXTS = 10000
+
 def load():
     global _vec
     if _vec is not None: return _vec
     if _USE_EMB:
         try:
+            import torch
             from sentence_transformers import SentenceTransformer
-            _vec = SentenceTransformer("all-MiniLM-L6-v2")
+            dev = "cuda" if torch.cuda.is_available() else "cpu"
+            _vec = SentenceTransformer("all-MiniLM-L6-v2", device=dev)
+            if dev == "cuda":
+                _vec.half()
             return _vec
         except Exception:
             pass
-    # fallback: TF-IDF
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    _vec = TfidfVectorizer(max_features=5000, ngram_range=(1,2))
+    # fallback: TF-IDF on hashed uni/bigrams (no vocabulary to build)
+    from sklearn.pipeline import Pipeline
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    _vec = Pipeline([
+        ("hash", HashingVectorizer(n_features=2**18, ngram_range=(1,2), alternate_sign=False, norm=None)),
+        ("tfidf", TfidfTransformer()),
+    ])
     return _vec
 
+def _hash(hasher, texts: List[str]):
+    if len(texts) < PARALLEL_MIN_TEXTS:
+        return hasher.transform(texts)
+    from joblib import Parallel, delayed
+    import scipy.sparse as sp
+    n_jobs = available_cpus()
+    step = -(-len(texts) // n_jobs)
+    parts = Parallel(n_jobs=n_jobs)(delayed(hasher.transform)(texts[i:i+step]) for i in range(0, len(texts), step))
+    return sp.vstack(parts).tocsr()
+
+def encode(texts: List[str]):
+    """Sentence embeddings in batches, as float32 numpy."""
+    return load().encode(texts, batch_size=_BATCH_SIZE, convert_to_numpy=True,
+                         normalize_embeddings=True, show_progress_bar=False).astype("float32", copy=False)
+
 def fit_transform(texts: List[str]):
     v = load()
+    if hasattr(v, "named_steps"):
+        return v.named_steps["tfidf"].fit_transform(_hash(v.named_steps["hash"], texts))
     if hasattr(v, "fit_transform"):
         return v.fit_transform(texts)
-    return v.encode(texts)
+    return encode(texts)
 
 def transform(texts: List[str]):
     v = load()
+    if hasattr(v, "named_steps"):
+        return v.named_steps["tfidf"].transform(_hash(v.named_steps["hash"], texts))
     if hasattr(v, "transform"):
         return v.transform(texts)
-    return v.encode(texts)
+    return encode(texts)
@@ -1,50 +1,110 @@
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List
+import numpy as np
 from .clients import ingestion
 
 WEIGHTS = {"design":0.4, "population":0.3, "outcomes":0.3}
 
+# compiled once at import instead of per call
+DESIGN_RES = {
+    "RCT": re.compile(r"randomi[sz]ed|placebo|double-?blind", re.I),
+    "Cohort": re.compile(r"cohort|prospective|retrospective", re.I),
+    "CaseControl": re.compile(r"case-?control", re.I),
+}
+POP_RE = re.compile(r"type\s?2\s?diabetes|\bT2D\b|adult", re.I)
 
-def _has(text: str, pattern: str) -> bool:
-    return bool(re.search(pattern, text, flags=re.I))
+# all of the above as named groups, so one finditer pass answers design and population
+_DESIGN_GROUPS = {"RCT": "rct", "Cohort": "cohort", "CaseControl": "cc"}
+_DESIGN_POP_RE = re.compile("|".join(
+    [f"(?P<{g}>{DESIGN_RES[d].pattern})" for d, g in _DESIGN_GROUPS.items()] +
+    [f"(?P<pop>{POP_RE.pattern})"]), re.I)
 
+# decision codes from _score_ft
+FT_UNAVAILABLE, FT_HIGH, FT_REVIEW, FT_LOW = 0, 1, 2, 3
+_DECISIONS = {
+    FT_UNAVAILABLE: (False, "fulltext_unavailable"),
+    FT_HIGH: (True, "ft_score_high"),
+    FT_REVIEW: (False, "human_review"),
+    FT_LOW: (False, "ft_score_low"),
+}
 
-def check_fulltext(study_id: str, protocol: Dict) -> Dict:
+
+def _design_pop(methods: str, results: str, design_groups: set, need_pop: bool):
+    """(any of design_groups in methods, POP_RE in results+methods) from one scan.
+
+    Design matches only count inside methods, i.e. at or after len(results)
+    when results is scanned too; the scan stops once both answers are known.
+    """
+    design_ok, pop_ok = not design_groups, not need_pop
+    if design_ok and pop_ok:
+        return design_ok, pop_ok
+    text, start = (results + methods, len(results)) if need_pop else (methods, 0)
+    for m in _DESIGN_POP_RE.finditer(text):
+        g = m.lastgroup
+        if g == "pop":
+            pop_ok = True
+        elif g in design_groups and m.start() >= start:
+            design_ok = True
+        if design_ok and pop_ok:
+            break
+    return design_ok, pop_ok
+
+
+@lru_cache(maxsize=32)
+def _outcome_re(outcomes: tuple):
+    # any outcome mentioned (literal, case-insensitive) as one alternation; cached per protocol
+    return re.compile("|".join(f"(?:{re.escape(o)})" for o in outcomes), re.I)
+
+
+def fulltext_features(study_id: str, protocol: Dict):
+    """(available, design_ok, pop_ok, outcome_ok) for one study; the I/O-bound part."""
     ft = ingestion.get_fulltext_text(study_id)
     if ft.get("status") == "unavailable":
-        return {"include": False, "reason": "fulltext_unavailable", "score": 0.0}
+        return False, False, False, False
 
     meta = ingestion.get_metadata(study_id)
     sections = ft.get("sections", {})
     methods = sections.get("methods", "")
     results = sections.get("results", "") + "\n" + sections.get("abstract", "")
 
-    # DESIGN
+    # DESIGN (metadata first, else text) and POPULATION in a single regex pass
     designs = protocol.get("designs", [])
-    design_ok = False
-    if meta.get("study_design") in designs:
-        design_ok = True
-    else:
-        for d in designs:
-            if d == "RCT" and _has(methods, r"randomi[sz]ed|placebo|double-?blind"):
-                design_ok = True
-            if d == "Cohort" and _has(methods, r"cohort|prospective|retrospective"):
-                design_ok = True
-            if d == "CaseControl" and _has(methods, r"case-?control"):
-                design_ok = True
-    # POPULATION
-    pop_ok = _has(results+methods, r"type\s?2\s?diabetes|\bT2D\b|adult") if protocol.get("pico",{}).get("population") else True
+    meta_design = meta.get("study_design") in designs
+    design_groups = set() if meta_design else {_DESIGN_GROUPS[d] for d in designs if d in _DESIGN_GROUPS}
+    design_ok, pop_ok = _design_pop(methods, results, design_groups, bool(protocol.get("pico",{}).get("population")))
+    design_ok = meta_design or (bool(design_groups) and design_ok)
 
     # OUTCOMES
     outs = protocol.get("pico",{}).get("outcomes", [])
-    outcome_ok = any(_has(results, re.escape(o)) for o in outs) if outs else True
+    outcome_ok = bool(_outcome_re(tuple(outs)).search(results)) if outs else True
+    return True, bool(design_ok), pop_ok, outcome_ok
 
-    score = (WEIGHTS["design"]*(1.0 if design_ok else 0.0) +
-             WEIGHTS["population"]*(1.0 if pop_ok else 0.0) +
-             WEIGHTS["outcomes"]*(1.0 if outcome_ok else 0.0))
 
-    if score >= 0.75:
-        return {"include": True, "reason": "ft_score_high", "score": round(score,2)}
-    if score >= 0.55:
-        return {"include": False, "reason": "human_review", "score": round(score,2)}
-    return {"include": False, "reason": "ft_score_low", "score": round(score,2)}
\ No newline at end of file
+def _score_ft(features, w_design, w_pop, w_out):
+    """Weighted score and decision code per row of features (available, design, pop, outcome)."""
+    available = features[:, 0] != 0
+    flags = (features[:, 1:] != 0).astype(np.float64)
+    # same left-to-right sum as the per-row form; unavailable rows score 0
+    scores = np.where(available, w_design*flags[:, 0] + w_pop*flags[:, 1] + w_out*flags[:, 2], 0.0)
+    codes = np.select([~available, scores >= 0.75, scores >= 0.55], [FT_UNAVAILABLE, FT_HIGH, FT_REVIEW], FT_LOW)
+    return scores, codes
+
+
+def score_fulltext(features: List[tuple]) -> List[Dict]:
+    """Decisions for rows of fulltext_features(), scored in one call."""
+    feats = np.array(features, dtype=np.uint8).reshape(len(features), 4)
+    scores, codes = _score_ft(feats, WEIGHTS["design"], WEIGHTS["population"], WEIGHTS["outcomes"])
+    out = []
+    for score, code in zip(scores.tolist(), codes.tolist()):
+        include, reason = _DECISIONS[code]
+        out.append({"include": include, "reason": reason, "score": round(score,2)})
+    return out
+
+
+def check_fulltext_batch(study_ids: List[str], protocol: Dict) -> List[Dict]:
+    return score_fulltext([fulltext_features(sid, protocol) for sid in study_ids])
+
+
+def check_fulltext(study_id: str, protocol: Dict) -> Dict:
+    return check_fulltext_batch([study_id], protocol)[0]
@@ -0,0 +1,34 @@
+"""JSONL reading/writing shared by the screening CLIs.
+Uses orjson if available (works on bytes directly); else stdlib json.
+"""
+import json
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads(line: bytes):
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals; stdlib json accepts them
+    return json.loads(line)
+
+
+def load_jsonl(path):
+    # binary + large buffer: no per-line text decode before parsing
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def dumps_line(rec) -> bytes:
+    """One JSONL line as UTF-8 bytes, for files opened in "wb" mode."""
+    if HAS_ORJSON:
+        return orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
@@ -1,18 +1,42 @@
 import re
-from typing import List
+from typing import List, Tuple
+from .multipattern import HAS_HYPERSCAN, can_scan, compile_groups, compile_re, groups_hit
+
+_ESCAPE_OR_LITERAL = re.compile(r"\\.|[^\\]+", re.S)
+
+def _lower_pattern(p: str) -> str:
+    # lowercase the literal parts only; escapes such as \S, \D, \B keep their meaning
+    return _ESCAPE_OR_LITERAL.sub(lambda m: m.group(0) if m.group(0)[0] == "\\" else m.group(0).lower(), p)
+
+def _union(pats: List[str]) -> "re.Pattern":
+    # one alternation = one scan; only "did any pattern hit" matters.
+    # Patterns are lowercased and matched against lowercased text (no re.I case folding).
+    return compile_re("|".join(f"(?:{p})" for p in pats))
 
 class RulePack:
+    """Keyword rules; all matching is on lowercased text (callers can pass text.lower() once)."""
+
     def __init__(self, positives: List[str], negatives: List[str], design: List[str]):
-        self.POS = [re.compile(p, re.I) for p in positives]
-        self.NEG = [re.compile(p, re.I) for p in negatives]
-        self.DESIGN = [re.compile(p, re.I) for p in design]
+        positives, negatives, design = ([_lower_pattern(p) for p in pats] for pats in (positives, negatives, design))
+        self.POS_RE = _union(positives)
+        self.NEG_RE = _union(negatives)
+        self.DESIGN_RE = _union(design)
+        # hyperscan: all three lists in one database, match id = 0 pos / 1 neg / 2 design
+        self._hs = compile_groups([positives, negatives, design]) if HAS_HYPERSCAN else None
 
-    def fires_any(self, pats, text: str) -> bool:
-        return any(p.search(text) for p in pats)
+    def pos(self, text: str) -> bool: return bool(self.POS_RE.search(text.lower()))
+    def neg(self, text: str) -> bool: return bool(self.NEG_RE.search(text.lower()))
+    def design_hit(self, text: str) -> bool: return bool(self.DESIGN_RE.search(text.lower()))
 
-    def pos(self, text: str) -> bool: return self.fires_any(self.POS, text)
-    def neg(self, text: str) -> bool: return self.fires_any(self.NEG, text)
-    def design_hit(self, text: str) -> bool: return self.fires_any(self.DESIGN, text)
+    def hits(self, text: str, text_lower: str = None) -> Tuple[bool, bool, bool]:
+        """(pos, neg, design_hit); a single pass when hyperscan can scan the text."""
+        if text_lower is None:
+            text_lower = text.lower()
+        if can_scan(self._hs, text_lower):
+            found = groups_hit(self._hs, text_lower)
+            return 0 in found, 1 in found, 2 in found
+        return (bool(self.POS_RE.search(text_lower)), bool(self.NEG_RE.search(text_lower)),
+                bool(self.DESIGN_RE.search(text_lower)))
 
 # Seed packs for hackathon TCs (extendable)
 RESVERATROL_T2D = RulePack(
@@ -0,0 +1,77 @@
+"""Single-pass multi-pattern matching.
+Uses hyperscan if available (all patterns in one DFA scan); callers keep
+their compiled alternations (compile_re) as the fallback.
+Set USE_PCRE2=1 to compile those alternations with PCRE2 + JIT (pcre2 package).
+"""
+import os, re
+from typing import List, Set
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import pcre2
+    HAS_PCRE2 = True
+except ImportError:
+    HAS_PCRE2 = False
+
+USE_PCRE2 = HAS_PCRE2 and os.getenv("USE_PCRE2", "0").lower() in {"1","true","yes"}
+
+
+def compile_re(pattern: str):
+    """
+    re.compile, or a JIT-compiled PCRE2 pattern when USE_PCRE2 is on.
+    Both expose search/finditer/.pattern the same way. There is no flags
+    argument (re and pcre2 flag values differ); use inline flags such as (?i).
+    Falls back to re if PCRE2 rejects the pattern.
+    """
+    if USE_PCRE2:
+        try:
+            return pcre2.compile(pattern, jit=True)
+        except pcre2.error:
+            pass
+    return re.compile(pattern)
+
+
+def compile_groups(groups: List[List[str]], caseless: bool = False):
+    """
+    One database over every pattern; a pattern's match id is the index of its group.
+    Returns None if hyperscan rejects a pattern.
+    """
+    exprs, ids = [], []
+    for gid, pats in enumerate(groups):
+        for p in pats:
+            exprs.append(p.encode("utf-8"))
+            ids.append(gid)
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    if caseless:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    db = hyperscan.Database()
+    try:
+        db.compile(expressions=exprs, ids=ids, elements=len(exprs), flags=[flags] * len(exprs))
+    except hyperscan.error:
+        return None  # a pattern hyperscan cannot handle: callers stay on re
+    return db
+
+
+def groups_hit(db, text: str) -> Set[int]:
+    """
+    Indices of the groups with at least one matching pattern in text.
+    Only for ASCII text (see can_scan): hyperscan's \\b, \\s and caseless
+    matching are ASCII-only, Python's re is Unicode-aware.
+    """
+    found = set()
+
+    def on_match(id_, start, end, flags, context):
+        found.add(id_)
+
+    db.scan(text.encode("ascii"), match_event_handler=on_match)
+    return found
+
+
+def can_scan(db, text: str) -> bool:
+    """True when db exists and text is ASCII, so a scan agrees exactly with re."""
+    return db is not None and text.isascii()
@@ -1,16 +1,9 @@
-import json
 from collections import Counter, defaultdict
 from typing import Dict
+from .jsonl import load_jsonl
 
 """Reads TA and FT decision logs and emits PRISMA-style counters as JSON."""
 
-def load_jsonl(path):
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                yield json.loads(line)
-
-
 def make_prisma(ta_path: str, ft_path: str = None) -> Dict:
     prisma = {
         "identified": defaultdict(int),  # optional by source
@@ -23,29 +16,33 @@ def make_prisma(ta_path: str, ft_path: str = None) -> Dict:
         "reasons": Counter()
     }
 
-    ids_ta = set()
+    # TA: one pass, counting decisions and exclusion reasons directly
+    reasons = prisma["reasons"]
+    ta_decisions = Counter()
     for r in load_jsonl(ta_path):
-        if r.get("stage") != "ta":
+        get = r.get
+        if get("stage") != "ta":
             continue
-        ids_ta.add(r["id"])
-        prisma["screened"] += 1
-        if r.get("decision") == "exclude":
-            prisma["ta_excluded"] += 1
-            prisma["reasons"][r.get("reason","unknown")] += 1
+        decision = get("decision")
+        ta_decisions[decision] += 1
+        if decision == "exclude":
+            reasons[get("reason","unknown")] += 1
+    prisma["screened"] = sum(ta_decisions.values())
+    prisma["ta_excluded"] = ta_decisions["exclude"]
 
     if ft_path:
-        seen = set()
+        # first fulltext decision per id wins; keep only (decision, reason) per id
+        first = {}
+        setdefault = first.setdefault
         for r in load_jsonl(ft_path):
-            if r.get("stage") != "fulltext":
-                continue
-            if r["id"] in seen: continue
-            seen.add(r["id"])
-            prisma["fulltext_assessed"] += 1
-            if r.get("decision") == "include":
-                prisma["included"] += 1
-            else:
-                prisma["fulltext_excluded"] += 1
-                prisma["reasons"][r.get("reason","unknown")] += 1
+            if r.get("stage") == "fulltext":
+                setdefault(r["id"], (r.get("decision"), r.get("reason","unknown")))
+        included = sum(decision == "include" for decision, _ in first.values())
+        # Counter.update over an iterable counts in C, in first-seen order
+        reasons.update(reason for decision, reason in first.values() if decision != "include")
+        prisma["fulltext_assessed"] = len(first)
+        prisma["included"] = included
+        prisma["fulltext_excluded"] = len(first) - included
 
     prisma["reasons"] = dict(prisma["reasons"])  # to JSON
     return prisma
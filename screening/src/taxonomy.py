@@ -1,5 +1,14 @@
 import re, json
+from functools import lru_cache
 from typing import Dict, List
+from .multipattern import HAS_HYPERSCAN, can_scan, compile_groups, compile_re, groups_hit
+
+# pyahocorasick is optional: all data-type keywords matched in one pass over the text
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 ARTICLE_TYPES = [
     ("Systematic review", [r"systematic review", r"meta-?analysis"]),
@@ -22,22 +31,47 @@ SPECIES = [
     ("Rattus norvegicus", [r"rat|rats"])
 ]
 
+# one compiled alternation per label, built once at import (text is lowercased, no flags)
+def _compile_table(table):
+    return [(label, compile_re("|".join(f"(?:{p})" for p in pats))) for label, pats in table]
+
+_ARTICLE_RES = _compile_table(ARTICLE_TYPES)
+_DESIGN_RES = _compile_table(STUDY_DESIGNS)
+_SPECIES_RES = _compile_table(SPECIES)
+
+# hyperscan: every label of every table in one database; match id = position in _HS_LABELS
+_HS_TABLES = (ARTICLE_TYPES, STUDY_DESIGNS, SPECIES)
+_HS_LABELS = [(t, label) for t, table in enumerate(_HS_TABLES) for label, _ in table]
+_HS_DB = compile_groups([pats for table in _HS_TABLES for _, pats in table]) if HAS_HYPERSCAN else None
+
 
-def classify_article(title: str, abstract: str) -> Dict:
-    text = f"{title}\n{abstract}".lower()
+def _first_labels(text: str) -> List:
+    """First matching label per table (None if none), in table order."""
+    if can_scan(_HS_DB, text):
+        found = groups_hit(_HS_DB, text)
+        first = [None] * len(_HS_TABLES)
+        for i in sorted(found):
+            t, label = _HS_LABELS[i]
+            if first[t] is None:
+                first[t] = label
+        return first
+    return [next((label for label, rx in res if rx.search(text)), None)
+            for res in (_ARTICLE_RES, _DESIGN_RES, _SPECIES_RES)]
+
+
+def classify_article(title: str, abstract: str, text_lower: str = None) -> Dict:
+    # text_lower: f"{title}\n{abstract}".lower() if the caller already has it
+    text = text_lower if text_lower is not None else f"{title}\n{abstract}".lower()
+    art_hit, design_hit, species_hit = _first_labels(text)
     art = "Original research"; art_conf=0.5
-    for label, pats in ARTICLE_TYPES:
-        if any(re.search(p, text) for p in pats):
-            art = label; art_conf=0.8
-            break
+    if art_hit is not None:
+        art = art_hit; art_conf=0.8
     design=""; dconf=0.3
-    for label, pats in STUDY_DESIGNS:
-        if any(re.search(p, text) for p in pats):
-            design=label; dconf=0.7; break
+    if design_hit is not None:
+        design=design_hit; dconf=0.7
     species=["Homo sapiens"]; sconf=0.5
-    for label, pats in SPECIES:
-        if any(re.search(p, text) for p in pats):
-            species=[label]; sconf=0.8; break
+    if species_hit is not None:
+        species=[species_hit]; sconf=0.8
     return {
         "article_type": art,
         "study_design": design or None,
@@ -46,12 +80,71 @@ def classify_article(title: str, abstract: str) -> Dict:
     }
 
 
-def classify_datatypes(protocol: Dict, title: str, abstract: str) -> List[str]:
-    taxonomy = protocol.get("taxonomy", {}).get("data_types", {})
-    text = f"{title}\n{abstract}".lower()
-    hits = []
-    for bucket, kws in taxonomy.items():
+def _datatype_patterns(buckets: tuple) -> list:
+    # literal substring match per bucket as one escaped alternation
+    return [(bucket, re.compile("|".join(re.escape(kw.lower()) for kw in kws)))
+            for bucket, kws in buckets if kws]
+
+
+def _datatype_automaton(buckets: tuple):
+    """
+    (automaton, always_hit): one Aho-Corasick automaton over every keyword whose
+    payload is the set of buckets listing it; an empty keyword matches any text,
+    so its buckets always hit.
+    """
+    by_kw, always = {}, set()
+    for bucket, kws in buckets:
         for kw in kws:
-            if kw.lower() in text:
-                hits.append(bucket); break
-    return sorted(set(hits))
+            kw = kw.lower()
+            if kw:
+                by_kw.setdefault(kw, set()).add(bucket)
+            else:
+                always.add(bucket)
+    ac = None
+    if by_kw:
+        ac = ahocorasick.Automaton()
+        for kw, bs in by_kw.items():
+            ac.add_word(kw, frozenset(bs))
+        ac.make_automaton()
+    return ac, frozenset(always)
+
+
+class DataTypeMatcher:
+    """
+    Data-type keyword matching for one protocol's taxonomy.data_types, compiled
+    once; build it per protocol and pass it to classify_datatypes for every record.
+    """
+    def __init__(self, protocol: Dict):
+        taxonomy = protocol.get("taxonomy", {}).get("data_types", {})
+        buckets = tuple((bucket, tuple(kws)) for bucket, kws in taxonomy.items())
+        if HAS_AHOCORASICK:
+            self._ac, self._always = _datatype_automaton(buckets)
+            self._patterns = None
+        else:
+            self._patterns = _datatype_patterns(buckets)
+
+    def match(self, text_lower: str) -> List[str]:
+        """Sorted buckets with a keyword in text_lower (already lowercased)."""
+        if self._patterns is not None:
+            return sorted({bucket for bucket, rx in self._patterns if rx.search(text_lower)})
+        hits = set(self._always)
+        if self._ac is not None:
+            for _, bs in self._ac.iter(text_lower):
+                hits |= bs
+        return sorted(hits)
+
+
+@lru_cache(maxsize=32)
+def _matcher_for(buckets: tuple) -> DataTypeMatcher:
+    return DataTypeMatcher({"taxonomy": {"data_types": dict(buckets)}})
+
+
+def classify_datatypes(protocol: Dict, title: str, abstract: str, text_lower: str = None,
+                       matcher: DataTypeMatcher = None) -> List[str]:
+    # matcher: DataTypeMatcher(protocol) built once by the caller; without one the
+    # taxonomy is re-keyed on every call to find its cached matcher
+    text = text_lower if text_lower is not None else f"{title}\n{abstract}".lower()
+    if matcher is None:
+        taxonomy = protocol.get("taxonomy", {}).get("data_types", {})
+        matcher = _matcher_for(tuple((bucket, tuple(kws)) for bucket, kws in taxonomy.items()))
+    return matcher.match(text)
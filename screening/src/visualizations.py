@@ -7,12 +7,15 @@ This module generates publication-ready visualizations for systematic reviews:
 """
 
 import json
+import sys
 from typing import Dict, Optional, List
 from pathlib import Path
 
 try:
     import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
+    # Non-interactive backend; leave it alone if pyplot is already live in this process
+    if "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use('Agg')
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
     from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
@@ -153,9 +156,9 @@ def create_prisma_flow_diagram(
             fontsize=7, color='gray')
 
     # Save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
 
     print(f"✓ PRISMA flow diagram saved to: {output_path}")
 
@@ -264,9 +267,9 @@ def create_forest_plot(
     ax.set_axisbelow(True)
 
     # Save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
 
     print(f"✓ Forest plot saved to: {output_path}")
 
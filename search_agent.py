@@ -1,8 +1,18 @@
+import asyncio
 import json
 import requests
 from urllib.parse import urlencode
 from time import sleep
 
+# httpx is optional: enables concurrent metadata batches over a pooled connection
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+ESUMMARY_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+
 
 # Build query from PICO
 
@@ -40,9 +50,19 @@ def search_pubmed(query, retmax=1000, date_from="2000/01/01", date_to="2025/10/1
     return pmids, count
 
 
+def _batch_records(batch, batch_data):
+    records = []
+    for pid in batch:
+        if pid in batch_data:
+            record = batch_data[pid]
+            # Add 'id' field for compatibility with screening module
+            record["id"] = f"PMID:{record.get('uid', pid)}"
+            records.append(record)
+    return records
+
+
 def fetch_metadata(pmids, batch_size=200):
     all_metadata = []
-    base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
     for i in range(0, len(pmids), batch_size):
         batch = pmids[i:i+batch_size]
         data = {
@@ -50,19 +70,91 @@ def fetch_metadata(pmids, batch_size=200):
             "id": ",".join(batch),
             "retmode": "json"
         }
-        response = requests.post(base_url, data=data)
+        response = requests.post(ESUMMARY_URL, data=data)
         response.raise_for_status()
-        batch_data = response.json().get("result", {})
-        for pid in batch:
-            if pid in batch_data:
-                record = batch_data[pid]
-                # Add 'id' field for compatibility with screening module
-                record["id"] = f"PMID:{record.get('uid', pid)}"
-                all_metadata.append(record)
+        all_metadata.extend(_batch_records(batch, response.json().get("result", {})))
         sleep(0.1)  
     return all_metadata
 
 
+class _RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart (across all tasks)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.interval
+
+
+def _retry_delay(response, attempt, backoff):
+    # honour a numeric Retry-After (sent with 429s), else exponential backoff
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return backoff * 2 ** attempt
+
+
+async def fetch_metadata_async(pmids, batch_size=200, max_concurrent=3, rate=3.0,
+                               max_retries=3, backoff=1.0):
+    """
+    Same as fetch_metadata, but batches are requested concurrently over one
+    httpx connection pool. Request starts are spaced to at most `rate` per
+    second (NCBI allows 3 req/s without an API key) and at most
+    `max_concurrent` are in flight. 429/5xx responses and transport errors
+    are retried with exponential backoff.
+    Returns (records, failures): records in PMID order from the batches that
+    succeeded, and one (batch_pmids, exception) per batch that still failed,
+    so callers can log and keep the missing PMIDs. Raises if every batch failed.
+    """
+    batches = [pmids[i:i+batch_size] for i in range(0, len(pmids), batch_size)]
+    sem = asyncio.Semaphore(max_concurrent)
+    limiter = _RateLimiter(rate)
+    limits = httpx.Limits(max_connections=max_concurrent, max_keepalive_connections=max_concurrent)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+        async def fetch(batch):
+            for attempt in range(max_retries + 1):
+                response = None
+                async with sem:
+                    await limiter.wait()
+                    try:
+                        response = await client.post(ESUMMARY_URL, data={
+                            "db": "pubmed",
+                            "id": ",".join(batch),
+                            "retmode": "json"
+                        })
+                        retryable = response.status_code == 429 or response.status_code >= 500
+                    except httpx.TransportError:
+                        if attempt == max_retries:
+                            raise
+                        retryable = True
+                if not retryable or attempt == max_retries:
+                    break
+                await asyncio.sleep(_retry_delay(response, attempt, backoff))
+            response.raise_for_status()
+            return _batch_records(batch, response.json().get("result", {}))
+
+        results = await asyncio.gather(*[fetch(b) for b in batches], return_exceptions=True)
+
+    all_metadata, failures = [], []
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            failures.append((batch, result))
+        else:
+            all_metadata.extend(result)
+    if failures and len(failures) == len(batches):
+        raise failures[0][1]
+    return all_metadata, failures
+
+
 def deduplicate_records(records):
     seen = set()
     unique = []
@@ -74,7 +166,8 @@ def deduplicate_records(records):
 
 
 def save_bibtex(records, filename="library.bib"):
-    with open(filename, "w", encoding="utf-8") as f:
+    # bytes + large buffer: one encode and one buffered write per entry
+    with open(filename, "wb", buffering=1 << 20) as f:
         for r in records:
             title = r.get("title", "").replace("{", "").replace("}", "")
             authors = " and ".join([a.get("name")
@@ -82,22 +175,21 @@ def save_bibtex(records, filename="library.bib"):
             year = r.get("pubdate", "")[:4]
             pmid = r.get("uid")
             bib_entry = f"@article{{pmid{pmid},\n  title={{ {title} }},\n  author={{ {authors} }},\n  year={{ {year} }},\n  journal={{ {r.get('source', '')} }},\n}}\n\n"
-            f.write(bib_entry)
+            f.write(bib_entry.encode("utf-8"))
     print(f"Saved BibTeX to {filename}")
 
 
 
 def save_ris(records, filename="library.ris"):
-    with open(filename, "w", encoding="utf-8") as f:
+    with open(filename, "wb", buffering=1 << 20) as f:
         for r in records:
-            f.write("TY  - JOUR\n")
-            f.write(f"TI  - {r.get('title', '')}\n")
-            for a in r.get("authors", []):
-                f.write(f"AU  - {a.get('name')}\n")
-            f.write(f"PY  - {r.get('pubdate', '')}\n")
-            f.write(f"JO  - {r.get('source', '')}\n")
-            f.write(f"ID  - {r.get('uid')}\n")
-            f.write("ER  - \n\n")
+            lines = ["TY  - JOUR", f"TI  - {r.get('title', '')}"]
+            lines.extend(f"AU  - {a.get('name')}" for a in r.get("authors", []))
+            lines.append(f"PY  - {r.get('pubdate', '')}")
+            lines.append(f"JO  - {r.get('source', '')}")
+            lines.append(f"ID  - {r.get('uid')}")
+            lines.append("ER  - \n\n")
+            f.write("\n".join(lines).encode("utf-8"))
     print(f"Saved RIS to {filename}")
 
 